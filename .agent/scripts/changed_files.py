@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Changed Files - Antigravity Kit
+===============================
+Git-diff scoped file lists for the project-scanning audit scripts.
+
+A file counts as changed when it differs from <ref> in the working tree
+(committed since <ref>, staged or unstaged) or is untracked and not ignored.
+Deleted files are left out, since there is nothing left to scan.
+
+Usage (from an audit script):
+    ref = pop_changed_since(sys.argv)       # strips --changed-since <ref>
+    files = changed_files(project_path, ref, extensions={'.tsx', '.jsx'})
+
+Usage (standalone):
+    python .agent/scripts/changed_files.py <ref> [path]
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+
+class GitDiffError(Exception):
+    """git is missing, the path is not a work tree, or the ref does not exist."""
+
+
+def git_paths(project_path: Path, args: List[str]) -> List[str]:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+    except FileNotFoundError:
+        raise GitDiffError("git not found")
+    if result.returncode != 0:
+        raise GitDiffError(result.stderr.strip() or f"git {args[0]} failed")
+    return [p for p in result.stdout.split('\0') if p]
+
+
+def changed_files(project_path, ref: str, extensions: Optional[Iterable[str]] = None,
+                  skip_dirs: Iterable[str] = ()) -> List[Path]:
+    """
+    Files under project_path changed since ref, as project_path / relative path.
+
+    extensions (lowercase suffixes) and skip_dirs (directory names anywhere in
+    the relative path) are optional filters. Paths are sorted for stable output.
+    """
+    project_path = Path(project_path)
+    rel_paths = set(git_paths(project_path, ["diff", "--name-only", "--relative", "-z", ref, "--"]))
+    rel_paths.update(git_paths(project_path, ["ls-files", "--others", "--exclude-standard", "-z"]))
+
+    extensions = {ext.lower() for ext in extensions} if extensions is not None else None
+    skip_dirs = set(skip_dirs)
+
+    files = []
+    for rel_path in sorted(rel_paths):
+        rel = Path(rel_path)
+        if extensions is not None and rel.suffix.lower() not in extensions:
+            continue
+        if skip_dirs.intersection(rel.parts[:-1]):
+            continue
+        filepath = project_path / rel
+        if filepath.is_file():
+            files.append(filepath)
+    return files
+
+
+def pop_changed_since(argv: List[str]) -> Optional[str]:
+    """Remove --changed-since <ref> / --changed-since=<ref> from argv and return the ref."""
+    for i, arg in enumerate(argv):
+        if arg.startswith("--changed-since="):
+            del argv[i]
+            return arg.split("=", 1)[1]
+        if arg == "--changed-since":
+            if i + 1 >= len(argv):
+                raise GitDiffError("--changed-since requires a git ref")
+            ref = argv[i + 1]
+            del argv[i:i + 2]
+            return ref
+    return None
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python changed_files.py <ref> [path]")
+        sys.exit(1)
+
+    try:
+        files = changed_files(sys.argv[2] if len(sys.argv) > 2 else ".", sys.argv[1])
+    except GitDiffError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for filepath in files:
+        print(filepath)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Check Report - Antigravity Kit
+==============================
+Machine-readable reports of an orchestrator run, for CI.
+
+    json   one document: run metadata, a summary and every check with its
+           category, status, duration, skip reason and (truncated) output
+    junit  JUnit XML: one <testsuite> per category, one <testcase> per
+           check; failures, errors (timeouts, crashes) and skips are marked
+           the way CI test reporters expect
+
+Outputs longer than OUTPUT_LIMIT characters keep their end, where the
+checkers print their summaries. Durations are the time spent in this run,
+so a result replayed from the result cache counts as 0s. Without an
+explicit path the report goes to .agent/.cache/, out of the project tree.
+
+Usage (from an orchestrator):
+    write_report(path, "junit", "verify_all", project_path, results, started)
+"""
+
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from project_index import CACHE_DIR
+
+REPORT_FORMATS = ("json", "junit")
+REPORT_EXTENSIONS = {"json": ".json", "junit": ".xml"}
+OUTPUT_LIMIT = 4000
+
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+# Characters XML 1.0 cannot carry, even escaped
+XML_INVALID = re.compile('[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]')
+
+
+def check_status(result: dict) -> str:
+    """passed, failed, skipped, timeout or error."""
+    if result.get("skipped"):
+        return "skipped"
+    if result["passed"]:
+        return "passed"
+    if result.get("error") == "Timeout":
+        return "timeout"
+    # A check that ran to completion has an exit code; a crash of the runner does not
+    return "failed" if result.get("exit_code") is not None or result.get("cached") else "error"
+
+
+def truncate(text: Optional[str], limit: int = OUTPUT_LIMIT) -> Tuple[str, bool]:
+    """The last `limit` characters of text, without ANSI colors, and whether anything was cut."""
+    text = ANSI_ESCAPE.sub('', text or '')
+    if len(text) <= limit:
+        return text, False
+    return f"[... {len(text) - limit} characters truncated ...]\n{text[-limit:]}", True
+
+
+def build_json(suite: str, project_path, results: List[dict], started: datetime,
+               url: Optional[str] = None, stopped_by: Optional[str] = None) -> dict:
+    checks = []
+    for r in results:
+        output, output_truncated = truncate(r.get("output"))
+        error, error_truncated = truncate(r.get("error"))
+        checks.append({
+            "name": r["name"],
+            "category": r.get("category"),
+            "required": r.get("required", False),
+            "status": check_status(r),
+            # Time spent in this run; a replayed check took that long when it last ran
+            "duration": 0.0 if r.get("cached") else round(r.get("duration") or 0, 3),
+            "cached": r.get("cached", False),
+            "cached_duration": round(r.get("duration") or 0, 3) if r.get("cached") else None,
+            "skip_reason": r.get("skip_reason"),
+            "exit_code": r.get("exit_code"),
+            "cpu_time": r.get("cpu_time"),
+            "peak_rss": r.get("peak_rss"),
+            "output": output,
+            "error": error,
+            "truncated": output_truncated or error_truncated,
+        })
+
+    statuses = [check["status"] for check in checks]
+    failed = sum(1 for status in statuses if status in ("failed", "timeout", "error"))
+    return {
+        "suite": suite,
+        "project": str(project_path),
+        "url": url,
+        "started": started.isoformat(timespec='seconds'),
+        "duration": round((datetime.now() - started).total_seconds(), 3),
+        "passed": failed == 0 and stopped_by is None,
+        "stopped_by": stopped_by,
+        "summary": {
+            "total": len(checks),
+            "passed": statuses.count("passed"),
+            "failed": failed,
+            "skipped": statuses.count("skipped"),
+            "cached": sum(1 for check in checks if check["cached"]),
+        },
+        "checks": checks,
+    }
+
+
+def _xml_text(text: str) -> str:
+    return XML_INVALID.sub('', text)
+
+
+def build_junit(report: dict) -> ET.ElementTree:
+    """JUnit XML for a report made by build_json."""
+    categories = {}
+    for check in report["checks"]:
+        categories.setdefault(check["category"] or report["suite"], []).append(check)
+
+    root = ET.Element("testsuites", name=report["suite"], time=f"{report['duration']:.3f}")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    for category, checks in categories.items():
+        counts = {
+            "tests": len(checks),
+            "failures": sum(1 for c in checks if c["status"] == "failed"),
+            "errors": sum(1 for c in checks if c["status"] in ("timeout", "error")),
+            "skipped": sum(1 for c in checks if c["status"] == "skipped"),
+        }
+        suite = ET.SubElement(root, "testsuite", name=category, timestamp=report["started"],
+                              time=f"{sum(c['duration'] for c in checks):.3f}",
+                              **{key: str(value) for key, value in counts.items()})
+        for key, value in counts.items():
+            totals[key] += value
+
+        for check in checks:
+            case = ET.SubElement(suite, "testcase", name=check["name"],
+                                 classname=f"{report['suite']}.{category}", time=f"{check['duration']:.3f}")
+            if check["status"] == "skipped":
+                ET.SubElement(case, "skipped", message=check["skip_reason"] or "skipped")
+            elif check["status"] == "failed":
+                failure = ET.SubElement(case, "failure", message=f"exit code {check['exit_code']}"
+                                        if check["exit_code"] is not None else "failed")
+                failure.text = _xml_text(check["error"] or check["output"])
+            elif check["status"] in ("timeout", "error"):
+                error = ET.SubElement(case, "error", message=check["status"])
+                error.text = _xml_text(check["error"])
+            if check["cached"]:
+                properties = ET.SubElement(case, "properties")
+                ET.SubElement(properties, "property", name="cached", value="true")
+            if check["output"]:
+                ET.SubElement(case, "system-out").text = _xml_text(check["output"])
+            if check["error"]:
+                ET.SubElement(case, "system-err").text = _xml_text(check["error"])
+
+    for key, value in totals.items():
+        root.set(key, str(value))
+    tree = ET.ElementTree(root)
+    ET.indent(tree)
+    return tree
+
+
+def write_report(path, fmt: str, suite: str, project_path, results: List[dict], started: datetime,
+                 url: Optional[str] = None, stopped_by: Optional[str] = None) -> Path:
+    """Write the report atomically; raises OSError if it cannot be written."""
+    report = build_json(suite, project_path, results, started, url, stopped_by)
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if fmt == "junit":
+            build_junit(report).write(tmp_path, encoding='utf-8', xml_declaration=True)
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def default_report_path(suite: str, fmt: str) -> Path:
+    """<suite>-report.json / .xml in the kit's cache dir, which is never indexed."""
+    return CACHE_DIR / f"{suite}-report{REPORT_EXTENSIONS[fmt]}"
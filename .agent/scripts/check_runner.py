@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Check Runner - Antigravity Kit
+==============================
+Runs the orchestrators' Python checkers inside warm worker processes.
+
+A checker opts in by exposing `main(argv)`: argv is its argument list
+without the program name, and it reports its status through sys.exit (or
+by returning) exactly as the script does. Such checkers are imported once
+per worker and called with stdout/stderr captured, so a check no longer
+pays interpreter startup and imports, and every check a worker runs
+shares its project index (load_index) and file contents (read_text).
+
+Checkers without that entry point keep running as `python <script> ...`
+subprocesses, as does every check when the orchestrator is given
+--isolate or the pool cannot be started.
+
+Every run also reports the CPU time and peak RSS of the check alone: from
+wait4() for a subprocess, and for an in-process check from the worker's
+usage, with its RSS high-water mark reset per check where Linux allows it
+(elsewhere it is the worker's peak so far). Platforms without the
+resource module report neither.
+
+Usage (from an orchestrator):
+    pool = open_pool(workers, project_path)     # None: subprocesses only
+    outcome = run_check(script_path, [project_path], timeout, pool)
+    outcome.returncode, outcome.stdout, outcome.cpu_time, outcome.peak_rss
+    pool.close()
+"""
+
+import contextlib
+import importlib.util
+import inspect
+import io
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from project_index import load_index
+
+
+class CheckCancelled(Exception):
+    """The run was cancelled while the check was in progress."""
+
+
+class CheckOutcome(NamedTuple):
+    returncode: int
+    stdout: str
+    stderr: str
+    cpu_time: Optional[float] = None   # user + system seconds
+    peak_rss: Optional[int] = None     # bytes
+    in_process: bool = False
+
+
+def _rss_bytes(maxrss: int) -> int:
+    # ru_maxrss is in kilobytes, except on macOS
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+def _cpu_time() -> Optional[float]:
+    """CPU seconds of this process and its waited-for children."""
+    if resource is None:
+        return None
+    own, children = resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def _reset_peak_rss() -> bool:
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss(was_reset: bool) -> Optional[int]:
+    if was_reset:
+        try:
+            with open('/proc/self/status') as f:
+                for line in f:
+                    if line.startswith('VmHWM:'):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            pass
+    return _rss_bytes(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) if resource is not None else None
+
+
+# Worker state: entry points by script path, None for scripts without one
+_ENTRY_POINTS: Dict[str, Optional[Callable]] = {}
+
+
+def _init_worker(project_path: str):
+    # Warm the index up front; forked workers usually inherit it already
+    load_index(project_path)
+
+
+def _entry_point(script_path: str) -> Optional[Callable]:
+    if script_path not in _ENTRY_POINTS:
+        entry = None
+        spec = importlib.util.spec_from_file_location(f"_check_{Path(script_path).stem}", script_path)
+        if spec is not None and spec.loader is not None:
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            main = getattr(module, "main", None)
+            if callable(main) and "argv" in inspect.signature(main).parameters:
+                entry = main
+        _ENTRY_POINTS[script_path] = entry
+    return _ENTRY_POINTS[script_path]
+
+
+def _call_entry_point(script_path: str, argv: List[str]) -> Optional[CheckOutcome]:
+    """The outcome of main(argv), or None if the script has no such entry point."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    try:
+        main = _entry_point(script_path)
+    except BaseException:
+        # Let the subprocess fallback report an import failure the usual way
+        return None
+    if main is None:
+        return None
+
+    saved_argv = sys.argv
+    sys.argv = [script_path, *argv]
+    was_reset = _reset_peak_rss()
+    cpu_before = _cpu_time()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                main(list(argv))
+                returncode = 0
+            except SystemExit as e:
+                # Same mapping as the interpreter's exit status
+                if e.code is None or isinstance(e.code, int):
+                    returncode = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        sys.argv = saved_argv
+    cpu_time = _cpu_time() - cpu_before if cpu_before is not None else None
+    return CheckOutcome(returncode, stdout.getvalue(), stderr.getvalue(), cpu_time, _peak_rss(was_reset), True)
+
+
+class CheckPool:
+    """
+    Worker processes that run checkers' main(argv) in-process.
+
+    close() terminates the workers, including any still busy with a check
+    that timed out or was cancelled. Once a check has been abandoned that
+    way, further checks run as subprocesses rather than queue behind it.
+    """
+
+    def __init__(self, workers: int, project_path: str):
+        self._pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(project_path,))
+        self._abandoned = False
+
+    def close(self):
+        self._pool.terminate()
+        self._pool.join()
+
+    def run(self, script_path, argv: List[str], timeout: float,
+            cancel: Optional[threading.Event] = None) -> Optional[CheckOutcome]:
+        """
+        Run a checker in a worker and return its outcome, or None if it has
+        to run as a subprocess instead.
+
+        Raises subprocess.TimeoutExpired after timeout seconds and
+        CheckCancelled once cancel is set; the worker is left to finish.
+        """
+        if self._abandoned:
+            return None
+        pending = self._pool.apply_async(_call_entry_point, (str(script_path), list(argv)))
+        deadline = time.monotonic() + timeout
+        while not pending.ready():
+            pending.wait(0.2)
+            if pending.ready():
+                break
+            if cancel is not None and cancel.is_set():
+                self._abandoned = True
+                raise CheckCancelled()
+            if time.monotonic() > deadline:
+                self._abandoned = True
+                raise subprocess.TimeoutExpired([str(script_path), *argv], timeout)
+        return pending.get()
+
+
+def open_pool(workers: int, project_path: str) -> Optional[CheckPool]:
+    """A CheckPool, or None where worker processes cannot be started."""
+    try:
+        return CheckPool(workers, project_path)
+    except (OSError, ImportError):
+        return None
+
+
+def _reap(proc: subprocess.Popen):
+    """The rusage of proc once it has exited (None without wait4), or False while it runs."""
+    if not hasattr(os, 'wait4'):
+        return None if proc.poll() is not None else False
+    pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+    if pid == 0:
+        return False
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return usage
+
+
+def _drain(stream, output: dict):
+    output[stream] = stream.read()
+
+
+def run_subprocess(cmd: List[str], timeout: float,
+                   cancel: Optional[threading.Event] = None) -> CheckOutcome:
+    """
+    Run cmd to completion and return its outcome.
+
+    Kills it and raises subprocess.TimeoutExpired after timeout seconds, or
+    CheckCancelled once cancel is set.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    # Drain the pipes on threads so the process can be reaped with wait4()
+    output = {}
+    readers = [threading.Thread(target=_drain, args=(stream, output), daemon=True)
+               for stream in (proc.stdout, proc.stderr)]
+    for reader in readers:
+        reader.start()
+
+    deadline = time.monotonic() + timeout
+    delay = 0.005
+    try:
+        while True:
+            usage = _reap(proc)
+            if usage is not False:
+                break
+            if cancel is not None and cancel.is_set():
+                proc.kill()
+                proc.wait()
+                raise CheckCancelled()
+            if time.monotonic() > deadline:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
+    finally:
+        for reader in readers:
+            reader.join()
+        proc.stdout.close()
+        proc.stderr.close()
+
+    if usage is None:
+        return CheckOutcome(proc.returncode, output[proc.stdout], output[proc.stderr])
+    return CheckOutcome(proc.returncode, output[proc.stdout], output[proc.stderr],
+                        usage.ru_utime + usage.ru_stime, _rss_bytes(usage.ru_maxrss))
+
+
+def run_check(script_path, argv: List[str], timeout: float, pool: Optional[CheckPool] = None,
+              cancel: Optional[threading.Event] = None) -> CheckOutcome:
+    """Run a checker in pool if it can, else as `python <script> argv...`."""
+    outcome = pool.run(script_path, argv, timeout, cancel) if pool is not None else None
+    if outcome is None:
+        outcome = run_subprocess(["python", str(script_path), *argv], timeout, cancel)
+    return outcome
@@ -9,6 +9,9 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --isolate          # Every check in its own interpreter
+    python scripts/checklist.py . --no-cache         # Rerun checks whose inputs are unchanged
+    python scripts/checklist.py . --report junit     # Also write .agent/.cache/checklist-report.xml for CI
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -23,9 +26,16 @@ Priority Order:
 import sys
 import subprocess
 import argparse
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from check_report import REPORT_FORMATS, default_report_path, write_report
+from check_runner import CheckPool, open_pool, run_check
+from project_index import share_index
+from result_cache import ResultCache
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -73,49 +83,66 @@ def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               pool: Optional[CheckPool] = None, cache: Optional[ResultCache] = None) -> dict:
     """
-    Run a validation script and capture results
+    Run a validation script and capture results, in pool when it can
+    
+    With a cache, a check whose code, arguments and inputs are unchanged
+    replays its last result instead of running.
     
     Returns:
-        dict with keys: name, passed, output, skipped
+        dict with keys: name, passed, output, skipped (and cached when replayed)
     """
     if not check_script_exists(script_path):
         print_warning(f"{name}: Script not found, skipping")
-        return {"name": name, "passed": True, "output": "", "skipped": True}
-    
-    print_step(f"Running: {name}")
+        return {"name": name, "passed": False, "output": "", "skipped": True, "skip_reason": "script not found"}
     
-    # Build command
-    cmd = ["python", str(script_path), project_path]
+    # Build arguments
+    argv = [project_path]
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
+        argv.append(url)
+    
+    key = cache.key(script_path, argv) if cache else None
+    cached = cache.lookup(name, key) if cache else None
+    if cached is not None:
+        if cached["passed"]:
+            print_success(f"{name}: PASSED (cached)")
+        else:
+            print_error(f"{name}: FAILED (cached)")
+            if cached["error"]:
+                print(f"  Error: {cached['error'][:200]}")
+        return {"name": name, **cached, "skipped": False, "cached": True}
+    
+    print_step(f"Running: {name}")
+    start_time = time.monotonic()
     
     # Run script
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+        returncode, stdout, stderr = run_check(script_path, argv, 300, pool)[:3]  # 5 minute timeout
+        duration = time.monotonic() - start_time
         
-        passed = result.returncode == 0
+        passed = returncode == 0
         
         if passed:
             print_success(f"{name}: PASSED")
         else:
             print_error(f"{name}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
+            if stderr:
+                print(f"  Error: {stderr[:200]}")
         
-        return {
+        result = {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
-            "skipped": False
+            "output": stdout,
+            "error": stderr,
+            "skipped": False,
+            "duration": duration,
+            "exit_code": returncode
         }
+        if cache:
+            cache.store(name, key, result)
+        return result
     
     except subprocess.TimeoutExpired:
         print_error(f"{name}: TIMEOUT (>5 minutes)")
@@ -132,11 +159,14 @@ def print_summary(results: List[dict]):
     passed_count = sum(1 for r in results if r["passed"] and not r.get("skipped"))
     failed_count = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
     skipped_count = sum(1 for r in results if r.get("skipped"))
+    cached_count = sum(1 for r in results if r.get("cached"))
     
     print(f"Total Checks: {len(results)}")
     print(f"{Colors.GREEN}✅ Passed: {passed_count}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed_count}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped_count}{Colors.ENDC}")
+    if cached_count:
+        print(f"♻️  Replayed from cache: {cached_count} (--no-cache to rerun)")
     print()
     
     # Detailed results
@@ -148,7 +178,7 @@ def print_summary(results: List[dict]):
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
-        print(f"{status} {r['name']}")
+        print(f"{status} {r['name']}{' (cached)' if r.get('cached') else ''}")
     
     print()
     
@@ -159,6 +189,25 @@ def print_summary(results: List[dict]):
         print_success("All checks PASSED ✨")
         return True
 
+def save_report(fmt: str, report_file: Optional[str], project_path: Path, results: List[dict],
+                started: datetime, url: Optional[str], stopped_by: Optional[str], performance_reason: Optional[str]):
+    """Write the --report file; checks this run did not get to are listed as skipped"""
+    by_name = {r["name"]: r for r in results}
+    entries = []
+    for category, checks in (("Core", CORE_CHECKS), ("Performance", PERFORMANCE_CHECKS)):
+        for name, _, required in checks:
+            reason = f"not run: {stopped_by} failed" if stopped_by else performance_reason
+            result = by_name.get(name) or {"name": name, "passed": False, "skipped": True, "skip_reason": reason}
+            entries.append({**result, "category": category, "required": required})
+    
+    path = report_file or default_report_path("checklist", fmt)
+    try:
+        path = write_report(path, fmt, "checklist", project_path, entries, started, url, stopped_by)
+    except OSError as e:
+        print_error(f"Could not write {fmt} report: {e}")
+        return
+    print(f"📄 {fmt.upper()} report: {path}")
+
 def main():
     parser = argparse.ArgumentParser(
         description="Run Antigravity Kit validation checklist",
@@ -167,11 +216,20 @@ def main():
 Examples:
   python scripts/checklist.py .                      # Core checks only
   python scripts/checklist.py . --url http://localhost:3000  # Include performance
+  python scripts/checklist.py . --report json --report-file reports/checklist.json
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run every check in its own interpreter instead of a warm in-process worker")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Rerun every check instead of replaying results whose inputs are unchanged")
+    parser.add_argument("--report", choices=REPORT_FORMATS,
+                        help="Also write a machine-readable report (durations, outputs, skip reasons) for CI")
+    parser.add_argument("--report-file", metavar="PATH",
+                        help="Where --report is written (default: .agent/.cache/checklist-report.json / .xml)")
     
     args = parser.parse_args()
     
@@ -181,35 +239,55 @@ Examples:
         print_error(f"Project path does not exist: {project_path}")
         sys.exit(1)
     
+    # List the project's files once; the checks load this index instead of globbing
+    share_index(project_path)
+    
     print_header("🚀 ANTIGRAVITY KIT - MASTER CHECKLIST")
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
     
+    started = datetime.now()
     results = []
+    performance_reason = "--skip-performance" if args.skip_performance else "requires --url"
+    # Python checkers run one after another in a single warm worker
+    pool = None if args.isolate else open_pool(1, str(project_path))
+    cache = None if args.no_cache else ResultCache(project_path, exclude=[args.report_file]).load()
     
-    # Run core checks
-    print_header("📋 CORE CHECKS")
-    for name, script_path, required in CORE_CHECKS:
-        script = project_path / script_path
-        result = run_script(name, script, str(project_path))
-        results.append(result)
-        
-        # If required check fails, stop
-        if required and not result["passed"] and not result.get("skipped"):
-            print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_summary(results)
-            sys.exit(1)
-    
-    # Run performance checks if URL provided
-    if args.url and not args.skip_performance:
-        print_header("⚡ PERFORMANCE CHECKS")
-        for name, script_path, required in PERFORMANCE_CHECKS:
+    try:
+        # Run core checks
+        print_header("📋 CORE CHECKS")
+        for name, script_path, required in CORE_CHECKS:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            result = run_script(name, script, str(project_path), pool=pool, cache=cache)
             results.append(result)
+            
+            # If required check fails, stop
+            if required and not result["passed"] and not result.get("skipped"):
+                print_error(f"CRITICAL: {name} failed. Stopping checklist.")
+                print_summary(results)
+                if args.report:
+                    save_report(args.report, args.report_file, project_path, results, started,
+                                args.url, name, performance_reason)
+                sys.exit(1)
+        
+        # Run performance checks if URL provided
+        if args.url and not args.skip_performance:
+            print_header("⚡ PERFORMANCE CHECKS")
+            for name, script_path, required in PERFORMANCE_CHECKS:
+                script = project_path / script_path
+                result = run_script(name, script, str(project_path), args.url, pool, cache)
+                results.append(result)
+    finally:
+        if pool is not None:
+            pool.close()
+        if cache is not None:
+            cache.save()
     
     # Print summary
     all_passed = print_summary(results)
+    if args.report:
+        save_report(args.report, args.report_file, project_path, results, started,
+                    args.url, None, performance_reason)
     
     sys.exit(0 if all_passed else 1)
 
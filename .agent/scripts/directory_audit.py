@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Directory Audit - Antigravity Kit
+=================================
+Directory walking and --jobs fan-out shared by the per-file auditors
+(ux_audit.py, mobile_audit.py).
+
+An auditor subclasses DirectoryAudit and provides EXTENSIONS, SKIP_DIRS,
+audit_file(path) and the issues / warnings / passed_count / files_checked
+counters audit_file fills in. audit_directory() then audits the project's
+files from the project index (or a --changed-since list), serially or
+across worker processes; workers' partial reports are merged in file
+order, so a parallel report matches a serial one.
+
+Usage (from an audit script):
+    class UXAuditor(DirectoryAudit): ...
+    jobs = pop_jobs(argv)                        # strips --jobs/-j <n>
+    auditor.audit_directory(path, changed_since, jobs)
+"""
+
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Set, Tuple
+
+from changed_files import changed_files
+from project_index import load_index
+
+PARALLEL_CHUNKS_PER_JOB = 8  # --jobs: files are handed to workers in ~8 chunks per process
+
+
+class DirectoryAudit(ABC):
+    """Base class: audit_directory() over the files an auditor accepts."""
+
+    EXTENSIONS: Set[str] = set()
+    SKIP_DIRS: Set[str] = set()
+
+    @abstractmethod
+    def audit_file(self, filepath: str) -> None:
+        """Audit one file, adding to issues / warnings / passed_count / files_checked."""
+
+    def collect_files(self, directory: str, changed_since: str = None) -> List[str]:
+        """Files audit_directory would audit, in path order (extensions match case-sensitively)."""
+        if changed_since is not None:
+            # Only files touched since the git ref, no tree walk
+            return [str(filepath) for filepath in changed_files(directory, changed_since, self.EXTENSIONS, self.SKIP_DIRS)
+                    if filepath.suffix in self.EXTENSIONS]
+        # The index groups by lowercased extension; keep only exact matches (App.TSX is not audited)
+        return [str(filepath) for filepath in sorted(load_index(directory).files(*self.EXTENSIONS))
+                if filepath.suffix in self.EXTENSIONS
+                and self.SKIP_DIRS.isdisjoint(filepath.relative_to(directory).parts[:-1])]
+
+    def audit_directory(self, directory: str, changed_since: str = None, jobs: int = 1) -> None:
+        files = self.collect_files(directory, changed_since)
+        if jobs <= 1 or len(files) <= 1:
+            for filepath in files:
+                self.audit_file(filepath)
+            return
+        chunksize = max(1, len(files) // (jobs * PARALLEL_CHUNKS_PER_JOB))
+        tasks = [(type(self), filepath) for filepath in files]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            # map() yields in file order, so the merged report matches a serial run
+            for issues, warnings, passed_count, files_checked in pool.map(_audit_file_task, tasks, chunksize=chunksize):
+                self.issues.extend(issues)
+                self.warnings.extend(warnings)
+                self.passed_count += passed_count
+                self.files_checked += files_checked
+
+
+def _audit_file_task(task: tuple) -> Tuple[List[str], List[str], int, int]:
+    """Audit one file in a worker process and return its partial report."""
+    auditor_class, filepath = task
+    auditor = auditor_class()
+    auditor.audit_file(filepath)
+    return auditor.issues, auditor.warnings, auditor.passed_count, auditor.files_checked
+
+
+def pop_jobs(argv: List[str]) -> int:
+    """Remove --jobs/-j <n> from argv and return the worker count (0 = one per CPU)."""
+    for i, arg in enumerate(argv):
+        if arg.startswith("--jobs="):
+            value = arg.split("=", 1)[1]
+            del argv[i]
+        elif arg in ("--jobs", "-j"):
+            if i + 1 >= len(argv):
+                raise ValueError(f"{arg} requires a number")
+            value = argv[i + 1]
+            del argv[i:i + 2]
+        else:
+            continue
+        try:
+            jobs = int(value)
+        except ValueError:
+            raise ValueError(f"--jobs expects a number, got {value!r}")
+        return jobs if jobs > 0 else (os.cpu_count() or 1)
+    return 1
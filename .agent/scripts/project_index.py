@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Project Index - Antigravity Kit
+===============================
+One listing of a project's files, shared by the audit scripts.
+
+Files come from `git ls-files` when the project is a git work tree, so
+.gitignore (nested ones, .git/info/exclude and global excludes too) is
+respected, and from an os.walk otherwise. Either way PRUNE_DIRS are never
+descended into, and the kit's own GENERATED_DIRS (.agent/.cache/, the
+ui-ux-pro-max .index/) are left out even where no .gitignore covers
+them. Each file is classified once by extension and by role
+(test, declaration, locale, api, api_spec).
+
+An orchestrator builds the index once, saves it and exports the file in
+AGENT_PROJECT_INDEX; every check it starts loads that file instead of
+walking the tree again. Checks run in-process by the orchestrators (see
+check_runner.py) also share the memoized index and read_text's file
+contents with every other check run by the same worker.
+
+Usage (from an audit script):
+    index = load_index(project_path)
+    pages = index.files('.html', '.jsx', '.tsx')
+    locales = index.files(roles={'locale'})
+    content = read_text(pages[0])
+
+Usage (standalone):
+    python .agent/scripts/project_index.py [path]    # build + save, print the index file
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from changed_files import GitDiffError, git_paths
+
+INDEX_ENV = "AGENT_PROJECT_INDEX"
+INDEX_VERSION = 1
+CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache"
+
+# Never project sources, whether ignored or not
+PRUNE_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv'}
+# Rewritten by the kit itself on every run, so never indexed even where no .gitignore covers them
+GENERATED_DIRS = (CACHE_DIR, Path(__file__).resolve().parents[1] / "skills" / "ui-ux-pro-max" / ".index")
+
+TEST_DIRS = {'test', 'tests', '__tests__', 'spec'}
+TEST_MARKERS = ('.test.', '.spec.', '_test.', '_spec.')
+LOCALE_DIRS = {'locales', 'translations', 'lang', 'i18n'}
+API_EXTENSIONS = {'.ts', '.js', '.py'}
+API_DIRS = {'routes': {'.ts', '.js', '.py'}, 'controllers': {'.ts', '.js'}, 'endpoints': {'.ts', '.py'}}
+API_SPEC_NAMES = {'swagger.json', 'swagger.yaml', 'openapi.json', 'openapi.yaml'}
+
+CONTENT_CACHE_CHARS = 64 << 20  # read_text stops caching new files past this much text
+
+
+def classify(rel_path: PurePosixPath) -> Tuple[str, ...]:
+    """Roles of a project-relative path."""
+    roles = []
+    name, suffix = rel_path.name, rel_path.suffix
+    dirs = rel_path.parts[:-1]
+
+    if TEST_DIRS.intersection(dirs) or any(marker in name for marker in TEST_MARKERS):
+        roles.append('test')
+    if name.endswith('.d.ts'):
+        roles.append('declaration')
+    # locales/**/*.json, translations/**, lang/**, i18n/**, messages/*.json, *.po
+    if suffix == '.po' or (suffix == '.json' and (LOCALE_DIRS.intersection(dirs) or rel_path.parent.name == 'messages')):
+        roles.append('locale')
+    # *api*.ts|js|py, routes/*, controllers/*, endpoints/*
+    if suffix in API_EXTENSIONS and ('api' in name[:-len(suffix)] or suffix in API_DIRS.get(rel_path.parent.name, ())):
+        roles.append('api')
+    if name in API_SPEC_NAMES or name.endswith(('.openapi.json', '.openapi.yaml')):
+        roles.append('api_spec')
+    return tuple(roles)
+
+
+def _pruned(parts: Iterable[str]) -> bool:
+    return not PRUNE_DIRS.isdisjoint(parts)
+
+
+def _generated_prefixes(root: Path) -> Tuple[str, ...]:
+    """GENERATED_DIRS that lie inside root, as root-relative POSIX paths."""
+    prefixes = []
+    resolved = root.resolve()
+    for generated in GENERATED_DIRS:
+        try:
+            prefixes.append(generated.relative_to(resolved).as_posix())
+        except ValueError:
+            pass
+    return tuple(prefixes)
+
+
+def _generated(rel: str, prefixes: Tuple[str, ...]) -> bool:
+    rel = rel.rstrip('/')
+    return any(rel == prefix or rel.startswith(prefix + '/') for prefix in prefixes)
+
+
+def _walk_files(root: Path, top: Path) -> List[str]:
+    """Relative paths under top, without descending into pruned or generated directories."""
+    prefixes = _generated_prefixes(root)
+    found = []
+    for dirpath, dirs, files in os.walk(top):
+        rel_dir = Path(os.path.relpath(dirpath, root)).as_posix()
+        prefix = '' if rel_dir == '.' else rel_dir + '/'
+        if _generated(rel_dir, prefixes):
+            dirs[:] = []
+            continue
+        dirs[:] = [d for d in dirs if d not in PRUNE_DIRS and not _generated(prefix + d, prefixes)]
+        found.extend(prefix + name for name in files)
+    return found
+
+
+def _git_files(root: Path) -> List[str]:
+    """Tracked and untracked-but-not-ignored files; raises GitDiffError outside a work tree."""
+    prefixes = _generated_prefixes(root)
+    deleted = set(git_paths(root, ["ls-files", "--deleted", "-z"]))
+    found = [rel for rel in git_paths(root, ["ls-files", "--cached", "-z"])
+             if rel not in deleted and not _pruned(rel.split('/')) and not _generated(rel, prefixes)]
+    # Whole untracked directories are listed once ('dir/'); walk them ourselves
+    # so an unignored node_modules is pruned rather than listed file by file
+    for rel in git_paths(root, ["ls-files", "--others", "--exclude-standard", "--directory", "-z"]):
+        if _pruned(rel.rstrip('/').split('/')) or _generated(rel, prefixes):
+            continue
+        if rel.endswith('/'):
+            found.extend(_walk_files(root, root / rel))
+        else:
+            found.append(rel)
+    return found
+
+
+def index_path(root) -> Path:
+    """One saved index per project, keyed by its absolute path."""
+    name = hashlib.sha1(str(Path(root).resolve()).encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f"project_index-{name}.json"
+
+
+class ProjectIndex:
+    """Project-relative files with their roles, grouped by extension."""
+
+    def __init__(self, root, entries: Dict[str, Tuple[str, ...]], source: str):
+        self.root = Path(root)
+        self.entries = entries
+        self.source = source
+        self._by_ext: Dict[str, List[str]] = {}
+        for rel in sorted(entries):
+            self._by_ext.setdefault(PurePosixPath(rel).suffix.lower(), []).append(rel)
+
+    @classmethod
+    def build(cls, root) -> "ProjectIndex":
+        root = Path(root)
+        try:
+            rel_paths, source = _git_files(root), "git"
+        except GitDiffError:
+            rel_paths, source = _walk_files(root, root), "walk"
+        return cls(root, {rel: classify(PurePosixPath(rel)) for rel in rel_paths}, source)
+
+    @classmethod
+    def load(cls, path, root) -> Optional["ProjectIndex"]:
+        """A saved index, or None if it is unreadable or was built for another project."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(data, dict) or data.get("version") != INDEX_VERSION
+                or data.get("root") != str(Path(root).resolve())):
+            return None
+        return cls(root, {rel: tuple(roles) for rel, roles in data["files"].items()}, data["source"])
+
+    def save(self, path=None) -> Optional[Path]:
+        """Atomically write the index; returns None if it could not be written."""
+        path = Path(path) if path else index_path(self.root)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": INDEX_VERSION, "root": str(self.root.resolve()),
+                           "source": self.source, "files": self.entries}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return None
+        return path
+
+    def files(self, *extensions: str, roles: Optional[Iterable[str]] = None) -> List[Path]:
+        """
+        Files with any of the given (lowercase) extensions, or all files.
+
+        Results are grouped by extension in the order given and sorted by
+        path within each group. With roles, only files having at least one
+        of them are returned.
+        """
+        groups = [self._by_ext.get(ext, []) for ext in extensions] if extensions else [sorted(self.entries)]
+        wanted = set(roles) if roles is not None else None
+        return [self.root / rel for group in groups for rel in group
+                if wanted is None or not wanted.isdisjoint(self.entries[rel])]
+
+
+_LOADED: Dict[str, ProjectIndex] = {}
+
+
+def load_index(root) -> ProjectIndex:
+    """
+    The index of root: the saved one named by AGENT_PROJECT_INDEX if it
+    covers root, else a fresh build. Memoized per process.
+    """
+    key = str(root)
+    index = _LOADED.get(key)
+    if index is None:
+        shared = os.environ.get(INDEX_ENV)
+        index = (ProjectIndex.load(shared, root) if shared else None) or ProjectIndex.build(root)
+        _LOADED[key] = index
+    return index
+
+
+def share_index(root) -> Optional[Path]:
+    """Build and save the index of root and export it to child processes."""
+    index = ProjectIndex.build(root)
+    _LOADED[str(root)] = index  # forked workers start with it loaded
+    path = index.save()
+    if path:
+        os.environ[INDEX_ENV] = str(path)
+    return path
+
+
+_CONTENTS: Dict[Tuple[str, str], Tuple[Tuple[int, int], str]] = {}
+_CONTENTS_SIZE = 0
+
+
+def read_text(path, errors: str = 'ignore') -> str:
+    """
+    Path.read_text(encoding='utf-8', errors=errors), memoized per process.
+
+    A cached text is reused while the file's mtime and size are unchanged, so
+    several checks reading the same pages pay for it once. Raises OSError
+    like Path.read_text.
+    """
+    global _CONTENTS_SIZE
+    key = (os.path.abspath(path), errors)
+    st = os.stat(key[0])
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONTENTS.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(key[0], 'r', encoding='utf-8', errors=errors) as f:
+        content = f.read()
+    if cached is not None:
+        _CONTENTS_SIZE -= len(cached[1])
+        del _CONTENTS[key]
+    if _CONTENTS_SIZE + len(content) <= CONTENT_CACHE_CHARS:
+        _CONTENTS[key] = (stamp, content)
+        _CONTENTS_SIZE += len(content)
+    return content
+
+
+def main():
+    root = Path(sys.argv[1] if len(sys.argv) > 1 else ".")
+    if not root.is_dir():
+        print(f"Error: not a directory: {root}", file=sys.stderr)
+        sys.exit(1)
+
+    index = ProjectIndex.build(root)
+    path = index.save()
+    print(f"{len(index.entries)} files ({index.source})")
+    if path:
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Result Cache - Antigravity Kit
+==============================
+Replays check results from earlier orchestrator runs when nothing a check
+depends on has changed.
+
+A result is stored under a key made of:
+    - the content of the check script and of the shared helpers it imports
+    - its arguments (project path, --url)
+    - a fingerprint of its input files: (path, mtime, size) of every project
+      file with one of the extensions in CHECK_INPUTS, or of every project
+      file for checks not listed there
+
+Input files come from the project index, so the fingerprint is taken once
+per run, before any check starts; it covers tracked and untracked files,
+not ignored ones, minus the files the orchestrator itself writes there
+(exclude, e.g. a --report-file). Checks whose results depend on anything else
+(UNCACHED_SCRIPTS) are never cached, and neither are runs that timed out,
+could not be started or were cancelled.
+
+Usage (from an orchestrator):
+    cache = ResultCache(project_path, exclude=[report_file]).load()
+    key = cache.key(script_path, argv)
+    result = cache.lookup(name, key)            # None: run the check
+    cache.store(name, key, result)
+    cache.save()
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from project_index import CACHE_DIR, load_index
+
+CACHE_VERSION = 1  # bump when the shape of cached results changes
+
+# Shared modules the checkers import; editing one invalidates every result
+HELPER_MODULES = ("changed_files.py", "directory_audit.py", "project_index.py")
+
+# Files each checker reads, by extension (mirrors the scripts' own file discovery)
+CHECK_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "type_coverage.py": ('.ts', '.tsx', '.py'),
+    "schema_validator.py": ('.prisma', '.ts'),
+    "ux_audit.py": ('.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'),
+    "accessibility_checker.py": ('.html', '.jsx', '.tsx'),
+    "seo_checker.py": ('.html', '.htm', '.jsx', '.tsx'),
+    "geo_checker.py": ('.html', '.htm', '.jsx', '.tsx'),
+    "mobile_audit.py": ('.tsx', '.ts', '.jsx', '.js', '.dart'),
+    "i18n_checker.py": ('.tsx', '.jsx', '.ts', '.js', '.vue', '.py', '.json', '.po'),
+}
+
+# Results depend on more than the indexed files, so they are always rerun:
+#   lighthouse / playwright: the site behind --url
+#   security_scan: `npm audit` (the live advisory database), and its own walk
+#       reads gitignored files too (a .env or a local secrets file)
+#   lint_runner / test_runner: node_modules and the ruff / mypy / pytest / npx
+#       tools on PATH, which no project fingerprint covers; tests may also
+#       depend on the environment they run in
+UNCACHED_SCRIPTS = {"lighthouse_audit.py", "playwright_runner.py", "security_scan.py",
+                    "lint_runner.py", "test_runner.py"}
+
+# What a cached result keeps; the rest is per-run bookkeeping
+CACHED_FIELDS = ("passed", "output", "error", "duration")
+
+
+def cache_path(project_path) -> Path:
+    """One result cache per project, keyed by its absolute path."""
+    name = hashlib.sha1(str(Path(project_path).resolve()).encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f"check_results-{name}.json"
+
+
+def _digest(paths: Iterable[Path]) -> str:
+    h = hashlib.sha1()
+    for path in paths:
+        h.update(str(path).encode('utf-8') + b'\0')
+        try:
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        except OSError:
+            h.update(b'<missing>')
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Last result of each check with the key it was computed under."""
+
+    def __init__(self, project_path, exclude: Iterable = ()):
+        self.project_path = Path(project_path)
+        self.path = cache_path(project_path)
+        # Outputs of the run itself (reports) that land inside the project, relative to it
+        self.exclude = set()
+        for path in exclude:
+            try:
+                self.exclude.add(Path(path).resolve().relative_to(self.project_path.resolve()).as_posix())
+            except (TypeError, ValueError):
+                pass  # no path, or outside the project
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._fingerprints: Dict[Optional[Tuple[str, ...]], str] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> "ResultCache":
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self.entries = data.get("checks", {})
+        return self
+
+    def fingerprint(self, extensions: Optional[Tuple[str, ...]]) -> str:
+        """Hash of the (path, mtime, size) of the input files; computed once per run."""
+        with self._lock:
+            if extensions not in self._fingerprints:
+                index = load_index(self.project_path)
+                files = index.files(*extensions) if extensions else index.files()
+                h = hashlib.sha1()
+                for filepath in sorted(files):
+                    rel = filepath.relative_to(self.project_path).as_posix()
+                    if rel in self.exclude:
+                        continue
+                    try:
+                        st = filepath.stat()
+                        stamp = f"{st.st_mtime_ns}:{st.st_size}"
+                    except OSError:
+                        stamp = "-"
+                    h.update(f"{rel}\0{stamp}\0".encode('utf-8'))
+                self._fingerprints[extensions] = h.hexdigest()
+            return self._fingerprints[extensions]
+
+    def key(self, script_path: Path, argv: List[str]) -> Optional[str]:
+        """Cache key of running script_path with argv, or None if it is never cached."""
+        name = Path(script_path).name
+        if name in UNCACHED_SCRIPTS:
+            return None
+        helpers = [Path(__file__).resolve().parent / helper for helper in HELPER_MODULES]
+        parts = {
+            "version": CACHE_VERSION,
+            "python": sys.version,
+            "code": _digest([Path(script_path), *helpers]),
+            "argv": list(argv),
+            "inputs": self.fingerprint(CHECK_INPUTS.get(name)),
+        }
+        return hashlib.sha1(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def lookup(self, name: str, key: Optional[str]) -> Optional[dict]:
+        """The stored result of check name if it was computed under key."""
+        if key is None:
+            return None
+        with self._lock:
+            entry = self.entries.get(name)
+            if entry is None or entry.get("key") != key:
+                return None
+            return dict(entry["result"])
+
+    def store(self, name: str, key: Optional[str], result: dict):
+        if key is None:
+            return
+        with self._lock:
+            self.entries[name] = {"key": key, "result": {field: result.get(field) for field in CACHED_FIELDS}}
+
+    def save(self):
+        """Atomically write the cache; a read-only tree just means no persistence."""
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": CACHE_VERSION, "checks": self.entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
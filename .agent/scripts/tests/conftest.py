@@ -0,0 +1,26 @@
+"""
+Tests for the orchestrator helpers in .agent/scripts/.
+
+Dot-directories are not collected by default, so name the directory:
+    python -m pytest .agent/scripts/tests
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+@pytest.fixture
+def write_script(tmp_path):
+    """Write a small checker script into tmp_path/checks and return its path."""
+    def write(name: str, source: str) -> Path:
+        path = tmp_path / "checks" / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(textwrap.dedent(source), encoding='utf-8')
+        return path
+    return write
@@ -0,0 +1,106 @@
+import json
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+import pytest
+
+from check_report import OUTPUT_LIMIT, build_json, default_report_path, write_report
+from project_index import CACHE_DIR
+
+STARTED = datetime(2026, 1, 1, 12, 0, 0)
+
+RESULTS = [
+    {"name": "Security Scan", "category": "Security", "required": True, "passed": True,
+     "output": "\x1b[92mclean\x1b[0m", "error": "", "duration": 1.23456, "exit_code": 0},
+    {"name": "Lint Check", "category": "Code Quality", "required": True, "passed": False,
+     "output": "x" * (OUTPUT_LIMIT + 10), "error": "2 errors", "duration": 2.0, "exit_code": 1},
+    {"name": "Type Coverage", "category": "Code Quality", "passed": False,
+     "output": "", "error": "Timeout", "duration": 300.0},
+    {"name": "Schema Validation", "category": "Data Layer", "passed": False,
+     "output": "", "error": "worker crashed\x00"},
+    {"name": "Test Runner", "category": "Testing", "passed": False, "skipped": True,
+     "skip_reason": "dependency did not pass: Lint Check"},
+    {"name": "UX Audit", "category": "UX & Accessibility", "passed": False,
+     "output": "3 issues", "error": "", "duration": 4.5, "cached": True},
+]
+
+
+@pytest.fixture
+def report():
+    return build_json("verify_all", "/project", RESULTS, STARTED, "http://localhost:3000")
+
+
+def test_json_statuses(report):
+    assert [check["status"] for check in report["checks"]] == [
+        "passed", "failed", "timeout", "error", "skipped", "failed"]
+    assert report["summary"] == {"total": 6, "passed": 1, "failed": 4, "skipped": 1, "cached": 1}
+    assert report["passed"] is False
+    assert report["stopped_by"] is None
+    assert report["url"] == "http://localhost:3000"
+
+
+def test_json_check_fields(report):
+    security, lint, _, _, tests, ux = report["checks"]
+    assert security["output"] == "clean"
+    assert security["duration"] == 1.235
+    assert security["required"] is True
+    assert lint["truncated"] is True
+    assert lint["output"].startswith("[... 10 characters truncated ...]\n")
+    assert lint["output"].endswith("x" * OUTPUT_LIMIT)
+    assert tests["skip_reason"] == "dependency did not pass: Lint Check"
+    # A replayed check took no time in this run
+    assert ux["cached"] is True
+    assert ux["duration"] == 0.0
+    assert ux["cached_duration"] == 4.5
+
+
+def test_json_stopped_run_fails(tmp_path):
+    passing = [dict(RESULTS[0])]
+    assert build_json("checklist", tmp_path, passing, STARTED)["passed"] is True
+    assert build_json("checklist", tmp_path, passing, STARTED, stopped_by="Lint Check")["passed"] is False
+
+
+def test_write_json(tmp_path):
+    path = write_report(tmp_path / "reports" / "verify.json", "json", "verify_all", tmp_path, RESULTS, STARTED)
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert data["suite"] == "verify_all"
+    assert len(data["checks"]) == len(RESULTS)
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_write_junit(tmp_path):
+    path = write_report(tmp_path / "verify.xml", "junit", "verify_all", tmp_path, RESULTS, STARTED)
+    root = ET.parse(path).getroot()
+    assert root.tag == "testsuites"
+    assert {key: root.get(key) for key in ("tests", "failures", "errors", "skipped")} == {
+        "tests": "6", "failures": "2", "errors": "2", "skipped": "1"}
+
+    suites = {suite.get("name"): suite for suite in root.iter("testsuite")}
+    assert list(suites) == ["Security", "Code Quality", "Data Layer", "Testing", "UX & Accessibility"]
+    quality = suites["Code Quality"]
+    assert {key: quality.get(key) for key in ("tests", "failures", "errors", "skipped")} == {
+        "tests": "2", "failures": "1", "errors": "1", "skipped": "0"}
+
+    cases = {case.get("name"): case for case in root.iter("testcase")}
+    assert cases["Security Scan"].find("failure") is None
+    assert cases["Lint Check"].find("failure").get("message") == "exit code 1"
+    assert cases["Type Coverage"].find("error").get("message") == "timeout"
+    assert cases["Schema Validation"].find("error").text == "worker crashed"
+    assert cases["Test Runner"].find("skipped").get("message") == "dependency did not pass: Lint Check"
+    ux = cases["UX Audit"]
+    assert ux.get("time") == "0.000"
+    assert ux.find("failure").get("message") == "failed"
+    assert ux.find("properties/property").attrib == {"name": "cached", "value": "true"}
+
+
+def test_unwritable_report_raises(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    with pytest.raises(OSError):
+        write_report(blocker / "report.json", "json", "verify_all", tmp_path, RESULTS, STARTED)
+
+
+@pytest.mark.parametrize("fmt, name", [("json", "checklist-report.json"), ("junit", "checklist-report.xml")])
+def test_default_path_is_out_of_tree(fmt, name):
+    # Never the working directory: a report there would change the result cache's fingerprint
+    assert default_report_path("checklist", fmt) == CACHE_DIR / name
@@ -0,0 +1,119 @@
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+from check_runner import CheckPool, run_check, run_subprocess
+
+SKILLS_DIR = Path(__file__).resolve().parents[2] / "skills"
+
+# Every checker the orchestrators run in-process, with the arguments they get
+CHECKERS = [
+    ("vulnerability-scanner/scripts/security_scan.py", ["--no-cache"]),
+    ("lint-and-validate/scripts/type_coverage.py", []),
+    ("database-design/scripts/schema_validator.py", []),
+    ("frontend-design/scripts/ux_audit.py", []),
+    ("frontend-design/scripts/accessibility_checker.py", []),
+    ("seo-fundamentals/scripts/seo_checker.py", []),
+    ("geo-fundamentals/scripts/geo_checker.py", []),
+    ("mobile-design/scripts/mobile_audit.py", []),
+    ("i18n-localization/scripts/i18n_checker.py", []),
+]
+
+PROJECT_FILES = {
+    "index.html": """<!DOCTYPE html><html><head><title>Shop</title></head>
+        <body><img src="a.png"><form><input type="text"></form>
+        <style>.box { transition: width 1s; margin: 0; } @keyframes pulse { from { top: 0 } }</style>
+        <p>Welcome to our store</p></body></html>""",
+    "src/App.tsx": """import React from 'react';
+        export const App = (props: any) => <div onClick={() => eval(props.code)}>
+          <img src="logo.png" /><button>Buy now</button><h1>Hello world</h1>
+          <TouchableOpacity style={{ width: 20, height: 20 }} /></div>;
+        const api_key = "sk_live_0123456789abcdef";""",
+    "src/api.ts": "export function get(x: any): any { return fetch(x); }\n",
+    "src/util.py": "import pickle\ndef load(b):\n    return pickle.loads(b)\n",
+    "src/locales/en.json": '{"hello": "Hello", "bye": "Bye"}',
+    "src/locales/pt.json": '{"hello": "Olá"}',
+    "prisma/schema.prisma": "model User {\n  id Int @id\n  email String\n  posts Post[]\n}\n",
+    "lib/main.dart": "import 'package:flutter/material.dart';\nvoid main() => runApp(Text('Hi'));\n",
+}
+
+
+@pytest.fixture(scope="module")
+def project(tmp_path_factory):
+    root = tmp_path_factory.mktemp("project")
+    for rel, content in PROJECT_FILES.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+    return root
+
+
+@pytest.fixture(scope="module")
+def pool(project):
+    pool = CheckPool(1, str(project))
+    yield pool
+    pool.close()
+
+
+def normalized(text: str) -> str:
+    # Reports are stamped with the time of the run
+    return re.sub(r'\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(\.\d+)?', '<time>', text)
+
+
+@pytest.mark.parametrize("script, extra", CHECKERS, ids=[Path(s).stem for s, _ in CHECKERS])
+def test_in_process_matches_subprocess(script, extra, project, pool):
+    path = SKILLS_DIR / script
+    argv = [str(project), *extra]
+
+    in_process = pool.run(path, argv, 120)
+    assert in_process is not None and in_process.in_process
+    subprocess_run = run_subprocess([sys.executable, str(path), *argv], 120)
+
+    assert in_process.returncode == subprocess_run.returncode
+    assert normalized(in_process.stdout) == normalized(subprocess_run.stdout)
+    assert in_process.stderr == subprocess_run.stderr
+    assert in_process.stdout  # every checker reports something
+
+
+@pytest.mark.parametrize("body, returncode, stdout, stderr", [
+    ("print('ok')", 0, "ok\n", ""),
+    ("print('bad'); sys.exit(3)", 3, "bad\n", ""),
+    ("print('warn', file=sys.stderr); sys.exit(None)", 0, "", "warn\n"),
+    ("sys.exit('fatal: no config')", 1, "", "fatal: no config\n"),
+    ("return 0", 0, "", ""),
+])
+def test_exit_status_matches_subprocess(body, returncode, stdout, stderr, write_script, pool, project):
+    path = write_script(f"exit_{abs(hash(body))}.py", f"""
+        import sys
+        def main(argv=None):
+            {body}
+        if __name__ == "__main__":
+            main()
+    """)
+    for outcome in (pool.run(path, [], 30), run_subprocess([sys.executable, str(path)], 30)):
+        assert (outcome.returncode, outcome.stdout, outcome.stderr) == (returncode, stdout, stderr)
+
+
+def test_uncaught_exception_fails_in_both(write_script, pool):
+    path = write_script("crash.py", """
+        def main(argv=None):
+            raise RuntimeError("boom")
+        if __name__ == "__main__":
+            main()
+    """)
+    for outcome in (pool.run(path, [], 30), run_subprocess([sys.executable, str(path)], 30)):
+        assert outcome.returncode == 1
+        assert outcome.stderr.rstrip().endswith("RuntimeError: boom")
+
+
+def test_script_without_entry_point_runs_as_subprocess(write_script, pool):
+    path = write_script("legacy.py", """
+        import sys
+        print("legacy", sys.argv[1:])
+    """)
+    assert pool.run(path, ["x"], 30) is None
+    outcome = run_check(path, ["x"], 30, pool)
+    assert not outcome.in_process
+    assert (outcome.returncode, outcome.stdout) == (0, "legacy ['x']\n")
@@ -0,0 +1,68 @@
+import pytest
+
+import project_index
+from directory_audit import DirectoryAudit, pop_jobs
+
+
+class LineAudit(DirectoryAudit):
+    """Counts lines; a line saying "bad" is an issue."""
+
+    EXTENSIONS = {'.tsx', '.css'}
+    SKIP_DIRS = {'dist'}
+
+    def __init__(self):
+        self.issues, self.warnings = [], []
+        self.passed_count = self.files_checked = 0
+
+    def audit_file(self, filepath: str) -> None:
+        self.files_checked += 1
+        with open(filepath, encoding='utf-8') as f:
+            for line in f:
+                if line.strip() == "bad":
+                    self.issues.append(filepath)
+                else:
+                    self.passed_count += 1
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.delenv(project_index.INDEX_ENV, raising=False)
+    monkeypatch.setattr(project_index, "_LOADED", {})
+    files = {"src/App.tsx": "ok\nbad\n", "src/Upper.TSX": "bad\n", "src/site.css": "ok\n",
+             "src/notes.md": "bad\n", "dist/App.tsx": "bad\n"}
+    for rel, content in files.items():
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text(content, encoding='utf-8')
+    return tmp_path
+
+
+def test_audit_file_is_abstract():
+    class NoAudit(DirectoryAudit):
+        pass
+
+    with pytest.raises(TypeError):
+        NoAudit()
+
+
+def test_collect_files_matches_extensions_case_sensitively(project):
+    files = LineAudit().collect_files(str(project))
+    assert files == [str(project / "src" / "App.tsx"), str(project / "src" / "site.css")]
+
+
+def test_parallel_report_matches_serial(project):
+    serial, parallel = LineAudit(), LineAudit()
+    serial.audit_directory(str(project))
+    parallel.audit_directory(str(project), jobs=2)
+    assert (parallel.issues, parallel.passed_count, parallel.files_checked) == \
+           (serial.issues, serial.passed_count, serial.files_checked) == ([str(project / "src" / "App.tsx")], 2, 2)
+
+
+@pytest.mark.parametrize("argv, jobs, rest", [
+    (["."], 1, ["."]),
+    ([".", "--jobs", "3"], 3, ["."]),
+    (["-j", "2", "."], 2, ["."]),
+    (["--jobs=4", "."], 4, ["."]),
+])
+def test_pop_jobs(argv, jobs, rest):
+    assert pop_jobs(argv) == jobs
+    assert argv == rest
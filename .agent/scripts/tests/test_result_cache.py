@@ -0,0 +1,128 @@
+import subprocess
+
+import pytest
+
+import project_index
+import result_cache
+from result_cache import ResultCache
+
+
+def git(project, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=project, check=True, capture_output=True)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A git work tree with one tracked page and one ignored directory."""
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / ".gitignore").write_text("build/\n")
+    (root / "index.html").write_text("<html></html>\n")
+    git(root, "init", "-q")
+    git(root, "add", ".")
+    git(root, "commit", "-q", "-m", "init")
+    monkeypatch.delenv(project_index.INDEX_ENV, raising=False)
+    monkeypatch.setattr(project_index, "_LOADED", {})
+    monkeypatch.setattr(project_index, "GENERATED_DIRS", (root / ".agent" / ".cache",))
+    monkeypatch.setattr(result_cache, "CACHE_DIR", tmp_path / "cache")
+    return root
+
+
+def key_of(project, script, argv=None):
+    """Key from a fresh run: a new cache and a rebuilt index, as an orchestrator would see them."""
+    project_index._LOADED.clear()
+    return ResultCache(project).key(script, argv or [str(project)])
+
+
+@pytest.fixture
+def script(write_script):
+    return write_script("whole_tree_check.py", "print('ok')\n")
+
+
+def test_unchanged_tree_keeps_key(project, script):
+    assert key_of(project, script) == key_of(project, script)
+
+
+def test_tracked_file_change_invalidates(project, script):
+    before = key_of(project, script)
+    (project / "index.html").write_text("<html><body></body></html>\n")
+    assert key_of(project, script) != before
+
+
+def test_untracked_file_invalidates(project, script):
+    before = key_of(project, script)
+    (project / "new.html").write_text("<html></html>\n")
+    assert key_of(project, script) != before
+
+
+def test_ignored_file_does_not_invalidate(project, script):
+    before = key_of(project, script)
+    (project / "build").mkdir()
+    (project / "build" / "out.html").write_text("<html></html>\n")
+    assert key_of(project, script) == before
+
+
+def test_kit_cache_does_not_invalidate(project, script):
+    before = key_of(project, script)
+    (project / ".agent" / ".cache").mkdir(parents=True)
+    (project / ".agent" / ".cache" / "check_results-0.json").write_text("{}")
+    assert key_of(project, script) == before
+
+
+def test_inputs_limited_to_check_extensions(project, write_script):
+    script = write_script("seo_checker.py", "print('ok')\n")
+    before = key_of(project, script)
+    (project / "notes.md").write_text("# notes\n")
+    assert key_of(project, script) == before
+    (project / "about.html").write_text("<html></html>\n")
+    assert key_of(project, script) != before
+
+
+def test_script_and_argv_are_part_of_key(project, script):
+    before = key_of(project, script)
+    assert key_of(project, script, [str(project), "http://localhost:3000"]) != before
+    script.write_text("print('changed')\n")
+    assert key_of(project, script) != before
+
+
+@pytest.mark.parametrize("name", ["security_scan.py", "lighthouse_audit.py", "playwright_runner.py",
+                                  "lint_runner.py", "test_runner.py"])
+def test_uncached_scripts_have_no_key(project, write_script, name):
+    cache = ResultCache(project)
+    key = cache.key(write_script(name, "print('ok')\n"), [str(project)])
+    assert key is None
+    cache.store("Check", key, {"passed": True})
+    assert cache.lookup("Check", key) is None
+    assert cache.entries == {}
+
+
+def test_store_save_load_round_trip(project, script):
+    cache = ResultCache(project)
+    key = cache.key(script, [str(project)])
+    cache.store("Check", key, {"passed": False, "output": "out", "error": "err", "duration": 1.5, "exit_code": 1})
+    cache.save()
+
+    replayed = ResultCache(project).load()
+    assert replayed.lookup("Check", key) == {"passed": False, "output": "out", "error": "err", "duration": 1.5}
+    assert replayed.lookup("Check", "other-key") is None
+    assert replayed.lookup("Other", key) is None
+
+
+def test_unreadable_cache_loads_empty(project):
+    cache = ResultCache(project)
+    cache.path.parent.mkdir(parents=True, exist_ok=True)
+    cache.path.write_text("not json")
+    assert ResultCache(project).load().entries == {}
+
+
+def test_excluded_report_does_not_invalidate(project, script):
+    report = project / "reports" / "verify.json"
+    report.parent.mkdir()
+    report.write_text("{}")
+    project_index._LOADED.clear()
+    before = ResultCache(project, exclude=[report]).key(script, [str(project)])
+    report.write_text('{"checks": []}')
+    project_index._LOADED.clear()
+    assert ResultCache(project, exclude=[report, None]).key(script, [str(project)]) == before
+    assert key_of(project, script) != before
@@ -0,0 +1,60 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "skills" / "vulnerability-scanner" / "scripts" / "security_scan.py"
+spec = importlib.util.spec_from_file_location("security_scan", SCRIPT)
+security_scan = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(security_scan)
+
+LARGE = 1 << 20  # where large files used to switch to the mmap path
+
+# Matches that only hold under str semantics: non-ASCII characters in a
+# class, Unicode case folding and whitespace, and invalid UTF-8 that
+# reading with errors='ignore' drops
+NON_ASCII = (
+    'password = "ééé"\n'
+    'paſſword = "abcd"\n'
+    'token = "0123456789"\n'
+).encode('utf-8') + b'ev\xffal(x)\n'
+
+ASCII = (
+    'const api_key = "sk_live_0123456789abcdef";\n'
+    'el.innerHTML = html;\n'
+    'const db = "postgres://user:pw@host/db";\n'
+    'eval(code)\n'
+).encode('utf-8')
+
+KEYS = ("secrets", "patterns", "config")
+
+
+def write_padded(path: Path, head: bytes, size: int) -> Path:
+    """head, then filler lines (matched by no rule) up to exactly size bytes."""
+    filler = b"// " + b"." * 76 + b"\n"
+    body = head + filler * ((size - len(head)) // len(filler))
+    path.write_bytes(body + b"/" * (size - len(body)))
+    return path
+
+
+@pytest.mark.parametrize("head", [NON_ASCII, ASCII], ids=["non-ascii", "ascii"])
+def test_findings_do_not_depend_on_file_size(tmp_path, head):
+    small = write_padded(tmp_path / "small.js", head, LARGE - 1)
+    large = write_padded(tmp_path / "large.js", head, LARGE + 1)
+    findings = security_scan.scan_file(small, "app.js", KEYS)
+    assert security_scan.scan_file(large, "app.js", KEYS) == findings
+    assert findings["secrets"] and findings["patterns"]
+
+
+def test_default_scan_keeps_text_semantics(tmp_path):
+    large = write_padded(tmp_path / "large.js", NON_ASCII, LARGE + 1)
+    findings = security_scan.scan_file(large, "app.js", KEYS)
+    # "ééé" is 3 characters, under the {4,} of the Password rule (6 bytes would pass it)
+    assert {f["type"]: f["count"] for f in findings["secrets"]} == {"Password": 1, "Token": 1}
+    assert [(f["line"], f["pattern"]) for f in findings["patterns"]] == [(4, "eval() usage")]
+
+
+def test_opt_in_mmap_matches_text_on_ascii(tmp_path):
+    large = write_padded(tmp_path / "large.js", ASCII, LARGE + 1)
+    mapped = security_scan.DEFAULT_LIMITS._replace(mmap_bytes=LARGE)
+    assert security_scan.scan_file(large, "app.js", KEYS, mapped) == security_scan.scan_file(large, "app.js", KEYS)
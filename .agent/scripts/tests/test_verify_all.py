@@ -0,0 +1,113 @@
+import json
+import time
+
+import pytest
+
+import verify_all
+from verify_all import run_checks
+
+
+@pytest.fixture
+def check(tmp_path, write_script):
+    """A check dict whose script logs its start/end to tmp_path/log.jsonl and exits with code."""
+    log = tmp_path / "log.jsonl"
+
+    def make(name: str, code: int = 0, required: bool = False, sleep: float = 0.0, category: str = "Tests") -> dict:
+        script = write_script(f"{name.lower().replace(' ', '_')}.py", f"""
+            import json, sys, time
+            def log(event):
+                with open({str(log)!r}, 'a') as f:
+                    f.write(json.dumps({{"check": {name!r}, "event": event, "at": time.monotonic()}}) + "\\n")
+            log("start")
+            time.sleep({sleep})
+            log("end")
+            sys.exit({code})
+        """)
+        return {"name": name, "category": category, "script": script, "required": required}
+    return make
+
+
+def events(tmp_path):
+    log = tmp_path / "log.jsonl"
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+def run(checks, tmp_path, **kwargs):
+    kwargs.setdefault("isolate", True)
+    return run_checks(checks, str(tmp_path), None, **kwargs)
+
+
+def test_serial_run_keeps_suite_order(check, tmp_path):
+    checks = [check("A"), check("B", code=1), check("C")]
+    results, stopped_by = run(checks, tmp_path)
+    assert stopped_by is None
+    assert [r["name"] for r in results] == ["A", "B", "C"]
+    assert [r["passed"] for r in results] == [True, False, True]
+    assert [e["check"] for e in events(tmp_path) if e["event"] == "start"] == ["A", "B", "C"]
+    assert all(r["category"] == "Tests" and r["exit_code"] in (0, 1) for r in results)
+
+
+def test_playwright_runs_when_lighthouse_fails(check, tmp_path):
+    checks = [check("Lighthouse Audit", code=1, required=True), check("Playwright E2E")]
+    results, _ = run(checks, tmp_path)
+    assert results[1]["passed"] and not results[1]["skipped"]
+
+
+def test_failed_dependency_skips_without_passing(check, tmp_path, monkeypatch):
+    monkeypatch.setattr(verify_all, "CHECK_DEPENDENCIES", {"B": ["A"], "C": ["Missing"]})
+    checks = [check("A", code=1), check("B"), check("C")]
+    results, _ = run(checks, tmp_path)
+    by_name = {r["name"]: r for r in results}
+    assert by_name["B"]["skipped"] and not by_name["B"]["passed"]
+    assert by_name["B"]["skip_reason"] == "dependency did not pass: A"
+    # A dependency outside the run is ignored
+    assert by_name["C"]["passed"] and not by_name["C"]["skipped"]
+    assert "B" not in {e["check"] for e in events(tmp_path)}
+
+
+def test_passed_dependency_runs_after_it(check, tmp_path, monkeypatch):
+    monkeypatch.setattr(verify_all, "CHECK_DEPENDENCIES", {"A": ["B"]})
+    results, _ = run([check("A"), check("B")], tmp_path, jobs=2)
+    assert [r["passed"] for r in results] == [True, True]
+    assert [e["check"] for e in events(tmp_path) if e["event"] == "start"] == ["B", "A"]
+
+
+def test_dependency_cycle_is_skipped(check, tmp_path, monkeypatch):
+    monkeypatch.setattr(verify_all, "CHECK_DEPENDENCIES", {"A": ["B"], "B": ["A"]})
+    results, _ = run([check("A"), check("B"), check("C")], tmp_path)
+    assert [(r["name"], r["passed"], r["skipped"], r.get("skip_reason")) for r in results] == [
+        ("A", False, True, "dependency cycle"),
+        ("B", False, True, "dependency cycle"),
+        ("C", True, False, None),
+    ]
+
+
+def test_skipped_results_share_one_status(check, tmp_path, monkeypatch):
+    monkeypatch.setattr(verify_all, "CHECK_DEPENDENCIES", {"B": ["A"]})
+    missing = {"name": "A", "category": "Tests", "script": tmp_path / "nope.py", "required": False}
+    results, _ = run([missing, check("B")], tmp_path)
+    assert [(r["passed"], r["skipped"]) for r in results] == [(False, True), (False, True)]
+    assert results[0]["skip_reason"] == "script not found"
+
+
+def test_shared_resource_is_never_held_twice(check, tmp_path, monkeypatch):
+    monkeypatch.setattr(verify_all, "CHECK_RESOURCES", {"A": {"browser"}, "B": {"browser"}})
+    results, _ = run([check("A", sleep=0.3), check("B", sleep=0.3), check("C", sleep=0.3)], tmp_path, jobs=3)
+    assert all(r["passed"] for r in results)
+    spans = {}
+    for e in events(tmp_path):
+        spans.setdefault(e["check"], {})[e["event"]] = e["at"]
+    a, b = spans["A"], spans["B"]
+    assert a["end"] <= b["start"] or b["end"] <= a["start"]
+
+
+def test_stop_on_fail_cancels_the_rest(check, tmp_path):
+    checks = [check("A", code=1, required=True), check("B"), check("C")]
+    started = time.monotonic()
+    results, stopped_by = run(checks, tmp_path, stop_on_fail=True)
+    assert stopped_by == "A"
+    assert [r["name"] for r in results] == ["A"]
+    assert {e["check"] for e in events(tmp_path)} == {"A"}
+    assert time.monotonic() - started < 30
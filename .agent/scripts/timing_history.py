@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Timing History - Antigravity Kit
+================================
+Per-check timings of verify_all runs, kept across runs, and the numbers
+behind `verify_all.py --timings`.
+
+Every run appends one JSON line per check that actually ran (replayed,
+skipped and cancelled checks are left out) to
+.agent/.cache/check_timings-<project>.jsonl:
+
+    {"run": "2026-10-17T09:30:00", "check": "UX Audit", "category": "UX & Accessibility",
+     "status": "failed", "exit_code": 1, "duration": 3.1, "cpu_time": 2.9,
+     "peak_rss": 81231872, "in_process": true}
+
+cpu_time and peak_rss are null where the platform cannot measure them.
+The oldest lines are dropped past HISTORY_MAX_RECORDS.
+
+Usage (from an orchestrator):
+    record_run(project_path, results, started)
+    stats = summarize(load_history(project_path), runs=20, slowdown=1.5)
+"""
+
+import hashlib
+import json
+import math
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from check_report import check_status
+from project_index import CACHE_DIR
+
+HISTORY_MAX_RECORDS = 5000
+MIN_BASELINE_RUNS = 3       # earlier runs needed before a check can be flagged as slower
+MIN_SLOWDOWN_SECONDS = 0.5  # ignore slowdowns smaller than this, whatever the ratio
+
+
+def history_path(project_path) -> Path:
+    """One history per project, keyed by its absolute path."""
+    name = hashlib.sha1(str(Path(project_path).resolve()).encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f"check_timings-{name}.jsonl"
+
+
+def record_run(project_path, results: List[dict], started: datetime) -> int:
+    """Append the checks of one run that actually ran; returns how many were recorded."""
+    run = started.isoformat(timespec='seconds')
+    records = [{
+        "run": run,
+        "check": r["name"],
+        "category": r.get("category"),
+        "status": check_status(r),
+        "exit_code": r.get("exit_code"),
+        "duration": round(r.get("duration", 0), 3),
+        "cpu_time": round(r["cpu_time"], 3) if r.get("cpu_time") is not None else None,
+        "peak_rss": r.get("peak_rss"),
+        "in_process": r.get("in_process", False),
+    } for r in results if not r.get("skipped") and not r.get("cached")]
+    if not records:
+        return 0
+
+    path = history_path(project_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        if len(lines) > HISTORY_MAX_RECORDS:
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines[-HISTORY_MAX_RECORDS:])
+            os.replace(tmp_path, path)
+    except OSError:
+        return 0
+    return len(records)
+
+
+def load_history(project_path) -> List[dict]:
+    """Recorded checks, oldest first; unreadable lines are skipped."""
+    records = []
+    try:
+        with open(history_path(project_path), 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and "check" in record and "duration" in record:
+                    records.append(record)
+    except OSError:
+        pass
+    return records
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile, or None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def summarize(records: List[dict], runs: int = 20, slowdown: float = 1.5) -> List[dict]:
+    """
+    Per-check statistics over each check's last `runs` recorded runs, in
+    order of first appearance.
+
+    A check is flagged as slower when its latest duration exceeds `slowdown`
+    times the median of the runs before it (at least MIN_BASELINE_RUNS of
+    them) by MIN_SLOWDOWN_SECONDS or more.
+    """
+    by_check: Dict[str, List[dict]] = {}
+    for record in records:
+        by_check.setdefault(record["check"], []).append(record)
+
+    stats = []
+    for check, history in by_check.items():
+        recent = history[-runs:]
+        durations = [r["duration"] for r in recent]
+        cpu_times = [r["cpu_time"] for r in recent if r.get("cpu_time") is not None]
+        peak_rss = [r["peak_rss"] for r in recent if r.get("peak_rss") is not None]
+        latest, baseline = durations[-1], percentile(durations[:-1], 50)
+        slower = (len(durations) > MIN_BASELINE_RUNS and latest > baseline * slowdown
+                  and latest - baseline >= MIN_SLOWDOWN_SECONDS)
+        stats.append({
+            "check": check,
+            "category": recent[-1].get("category"),
+            "runs": len(recent),
+            "failures": sum(1 for r in recent if r.get("status") != "passed"),
+            "p50": percentile(durations, 50),
+            "p95": percentile(durations, 95),
+            "cpu_p50": percentile(cpu_times, 50),
+            "peak_rss": max(peak_rss) if peak_rss else None,
+            "latest": latest,
+            "baseline": baseline,
+            "slower": slower,
+        })
+    return stats
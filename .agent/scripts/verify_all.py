@@ -8,6 +8,11 @@ Use this before deployment or major releases.
 
 Usage:
     python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> --jobs 4    # run independent checks concurrently
+    python scripts/verify_all.py . --url <URL> --isolate   # every check in its own interpreter
+    python scripts/verify_all.py . --url <URL> --no-cache  # rerun checks whose inputs are unchanged
+    python scripts/verify_all.py . --timings               # p50/p95 per check over recent runs
+    python scripts/verify_all.py . --url <URL> --report junit --report-file reports/verify.xml
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -22,13 +27,22 @@ Includes ALL checks:
     ✅ Mobile Audit (if applicable)
 """
 
+import os
 import sys
 import subprocess
 import argparse
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+from check_report import REPORT_FORMATS, default_report_path, write_report
+from check_runner import CheckCancelled, CheckPool, open_pool, run_check
+from project_index import share_index
+from result_cache import ResultCache
+from timing_history import load_history, record_run, summarize
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -45,17 +59,22 @@ def print_header(text: str):
     print(f"{Colors.BOLD}{Colors.CYAN}{text.center(70)}{Colors.ENDC}")
     print(f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.ENDC}\n")
 
+# Status lines are written in one call so concurrent checks never merge lines
+def print_line(text: str):
+    sys.stdout.write(f"{text}\n")
+    sys.stdout.flush()
+
 def print_step(text: str):
-    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
+    print_line(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
 
 def print_success(text: str):
-    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
+    print_line(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
 
 def print_warning(text: str):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
+    print_line(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
 
 def print_error(text: str):
-    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
+    print_line(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
 # Complete verification suite
 VERIFICATION_SUITE = [
@@ -147,47 +166,92 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+# Checks that start only once these have finished; a dependency that did not pass skips them.
+# Dependencies on checks that are not part of the run are ignored.
+CHECK_DEPENDENCIES: Dict[str, List[str]] = {}
+
+# Checks holding a common resource never run at the same time
+CHECK_RESOURCES: Dict[str, set] = {
+    "Lighthouse Audit": {"browser"},   # both drive a headless browser against --url
+    "Playwright E2E": {"browser"},
+    "Lint Check": {"npm"},             # concurrent npx runs race on the shared npm cache
+    "Test Suite": {"npm"},
+}
+
+CHECK_TIMEOUT = 600  # 10 minute timeout for slow checks
+
+def skipped_result(name: str, reason: str, category: Optional[str] = None, duration: float = 0) -> dict:
+    """Result of a check that did not run to completion; it neither passed nor failed"""
+    result = {"name": name, "passed": False, "skipped": True, "duration": duration, "skip_reason": reason}
+    if category is not None:
+        result["category"] = category
+    return result
+
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               cancel: Optional[threading.Event] = None, pool: Optional[CheckPool] = None,
+               cache: Optional[ResultCache] = None) -> dict:
+    """
+    Run validation script, in pool when it can; setting cancel stops it and
+    reports it as skipped. With a cache, an unchanged check replays its last result.
+    """
     if not script_path.exists():
         print_warning(f"{name}: Script not found, skipping")
-        return {"name": name, "passed": True, "skipped": True, "duration": 0}
+        return skipped_result(name, "script not found")
+    
+    # Build arguments
+    argv = [project_path]
+    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
+        argv.append(url)
+    
+    key = cache.key(script_path, argv) if cache else None
+    cached = cache.lookup(name, key) if cache else None
+    if cached is not None:
+        if cached["passed"]:
+            print_success(f"{name}: PASSED (cached)")
+        else:
+            print_error(f"{name}: FAILED (cached)")
+            if cached["error"]:
+                print_line(f"  {cached['error'][:300]}")
+        return {"name": name, **cached, "skipped": False, "cached": True}
     
     print_step(f"Running: {name}")
     start_time = datetime.now()
     
-    # Build command
-    cmd = ["python", str(script_path), project_path]
-    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
-    
     # Run
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
+        outcome = run_check(script_path, argv, CHECK_TIMEOUT, pool, cancel)
         
         duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
+        passed = outcome.returncode == 0
+        stderr = outcome.stderr
         
         if passed:
             print_success(f"{name}: PASSED ({duration:.1f}s)")
         else:
             print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
+            if stderr:
+                print_line(f"  {stderr[:300]}")
         
-        return {
+        result = {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "output": outcome.stdout,
+            "error": stderr,
             "skipped": False,
-            "duration": duration
+            "duration": duration,
+            "exit_code": outcome.returncode,
+            "cpu_time": outcome.cpu_time,
+            "peak_rss": outcome.peak_rss,
+            "in_process": outcome.in_process
         }
+        if cache:
+            cache.store(name, key, result)
+        return result
+    
+    except CheckCancelled:
+        duration = (datetime.now() - start_time).total_seconds()
+        print_warning(f"{name}: CANCELLED ({duration:.1f}s)")
+        return skipped_result(name, "cancelled", duration=duration)
     
     except subprocess.TimeoutExpired:
         duration = (datetime.now() - start_time).total_seconds()
@@ -199,6 +263,93 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
 
+def run_checks(checks: List[dict], project_path: str, url: Optional[str], jobs: int = 1,
+               stop_on_fail: bool = False, isolate: bool = False,
+               cache: Optional[ResultCache] = None) -> Tuple[List[dict], Optional[str]]:
+    """
+    Run checks with at most `jobs` at a time, honouring CHECK_DEPENDENCIES and
+    CHECK_RESOURCES; of the checks that are ready, the earliest in suite order
+    starts first, so jobs=1 runs the suite in order.
+
+    Python checkers exposing main(argv) run in a pool of `jobs` warm worker
+    processes sharing the project index and file contents; the rest, or all
+    of them with isolate, run as subprocesses. With a cache, checks whose
+    code, arguments and inputs are unchanged replay their last result.
+
+    With stop_on_fail, the first failing required check cancels the checks
+    still running and nothing else is started. Returns the results in suite
+    order and the name of the check that stopped the run, if any.
+    """
+    scheduled = {check["name"] for check in checks}
+    pending = list(checks)
+    running = {}   # future -> check
+    held = set()   # resources of running checks
+    results = {}
+    stopped_by = None
+    cancel = threading.Event()
+    current_category = None
+    
+    # Fork the check workers before any thread is started
+    check_pool = None if isolate else open_pool(jobs, project_path)
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            while running or (pending and stopped_by is None):
+                if stopped_by is None:
+                    for check in list(pending):
+                        if len(running) >= jobs:
+                            break
+                        name = check["name"]
+                        deps = [d for d in CHECK_DEPENDENCIES.get(name, []) if d in scheduled]
+                        if any(d not in results for d in deps):
+                            continue
+                        failed = [d for d in deps if not results[d]["passed"]]
+                        if failed:
+                            pending.remove(check)
+                            print_warning(f"{name}: skipped, {', '.join(failed)} did not pass")
+                            results[name] = skipped_result(name, f"dependency did not pass: {', '.join(failed)}",
+                                                           check["category"])
+                            continue
+                        needs = CHECK_RESOURCES.get(name, set())
+                        if needs & held:
+                            continue
+                        
+                        pending.remove(check)
+                        held |= needs
+                        # Category headers only make sense while checks run one at a time
+                        if jobs == 1 and check["category"] != current_category:
+                            current_category = check["category"]
+                            print_header(f"📋 {current_category.upper()}")
+                        future = pool.submit(run_script, name, check["script"], project_path, url, cancel,
+                                             check_pool, cache)
+                        running[future] = check
+                
+                if not running:
+                    # Only unsatisfiable dependencies (a cycle) can leave checks waiting here
+                    for check in pending:
+                        results[check["name"]] = skipped_result(check["name"], "dependency cycle", check["category"])
+                    break
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    check = running.pop(future)
+                    held -= CHECK_RESOURCES.get(check["name"], set())
+                    result = future.result()
+                    result["category"] = check["category"]
+                    results[check["name"]] = result
+                    
+                    # Stop on critical failure if flag set
+                    if (stop_on_fail and stopped_by is None and check["required"]
+                            and not result["passed"] and not result.get("skipped")):
+                        stopped_by = check["name"]
+                        cancel.set()
+    finally:
+        if check_pool is not None:
+            check_pool.close()
+        if cache is not None:
+            cache.save()
+    
+    return [results[check["name"]] for check in checks if check["name"] in results], stopped_by
+
 def print_final_report(results: List[dict], start_time: datetime):
     """Print comprehensive final report"""
     total_duration = (datetime.now() - start_time).total_seconds()
@@ -210,12 +361,15 @@ def print_final_report(results: List[dict], start_time: datetime):
     passed = sum(1 for r in results if r["passed"] and not r.get("skipped"))
     failed = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
     skipped = sum(1 for r in results if r.get("skipped"))
+    cached = sum(1 for r in results if r.get("cached"))
     
     print(f"Total Duration: {total_duration:.1f}s")
     print(f"Total Checks: {total}")
     print(f"{Colors.GREEN}✅ Passed: {passed}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped}{Colors.ENDC}")
+    if cached:
+        print(f"♻️  Replayed from cache: {cached} (--no-cache to rerun)")
     print()
     
     # Category breakdown
@@ -235,7 +389,12 @@ def print_final_report(results: List[dict], start_time: datetime):
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
-        duration_str = f"({r.get('duration', 0):.1f}s)" if not r.get("skipped") else ""
+        if r.get("skipped"):
+            duration_str = f"({r['skip_reason']})" if r.get("skip_reason") else ""
+        elif r.get("cached"):
+            duration_str = "(cached)"
+        else:
+            duration_str = f"({r.get('duration', 0):.1f}s)"
         print(f"  {status} {r['name']} {duration_str}")
     
     print()
@@ -260,6 +419,65 @@ def print_final_report(results: List[dict], start_time: datetime):
         print_success("✨ ALL CHECKS PASSED - Ready for deployment! ✨")
         return True
 
+def format_seconds(value: Optional[float]) -> str:
+    return f"{value:.1f}s" if value is not None else "-"
+
+def print_timings_report(project_path: Path, runs: int, slowdown: float) -> bool:
+    """Print p50/p95 per check over recent runs; returns False if a check got slower"""
+    stats = summarize(load_history(project_path), runs, slowdown)
+    
+    print_header(f"⏱️  CHECK TIMINGS (last {runs} runs)")
+    if not stats:
+        print_warning("No timing history yet - run the suite first")
+        return True
+    
+    print(f"{Colors.BOLD}{'Check':<22} {'Runs':>4} {'Fail':>4} {'p50':>7} {'p95':>7} {'CPU p50':>8} {'Peak RSS':>9} {'Latest':>7}{Colors.ENDC}")
+    for st in stats:
+        rss = f"{st['peak_rss'] / (1 << 20):.0f} MB" if st["peak_rss"] is not None else "-"
+        line = (f"{st['check']:<22} {st['runs']:>4} {st['failures']:>4} {format_seconds(st['p50']):>7} "
+                f"{format_seconds(st['p95']):>7} {format_seconds(st['cpu_p50']):>8} {rss:>9} {format_seconds(st['latest']):>7}")
+        print(f"{Colors.RED}{line}{Colors.ENDC}" if st["slower"] else line)
+    print()
+    
+    # Where the time goes: typical (p50) time per category
+    totals: Dict[str, float] = {}
+    for st in stats:
+        category = st["category"] or "Other"
+        totals[category] = totals.get(category, 0) + st["p50"]
+    grand_total = sum(totals.values()) or 1
+    print(f"{Colors.BOLD}Time by Category (sum of p50):{Colors.ENDC}")
+    for category, total in sorted(totals.items(), key=lambda item: -item[1]):
+        print(f"  {category:<22} {format_seconds(total):>7} {total / grand_total:>5.0%}")
+    print()
+    
+    slower = [st for st in stats if st["slower"]]
+    for st in slower:
+        print_warning(f"{st['check']}: {st['latest']:.1f}s in the latest run vs {st['baseline']:.1f}s median "
+                      f"({st['latest'] / st['baseline']:.1f}x)")
+    if slower:
+        print_error(f"{len(slower)} check(s) slower than {slowdown:g}x their median")
+        return False
+    print_success(f"No check slower than {slowdown:g}x its median")
+    return True
+
+def save_report(fmt: str, report_file: Optional[str], project_path: Path, checks: List[dict],
+                results: List[dict], start_time: datetime, url: Optional[str], stopped_by: Optional[str]):
+    """Write the --report file; checks a stopped run never started are listed as skipped"""
+    by_name = {r["name"]: r for r in results}
+    entries = []
+    for check in checks:
+        result = by_name.get(check["name"]) or skipped_result(check["name"], f"not run: {stopped_by} failed",
+                                                              check["category"])
+        entries.append({**result, "required": check["required"]})
+    
+    path = report_file or default_report_path("verify_all", fmt)
+    try:
+        path = write_report(path, fmt, "verify_all", project_path, entries, start_time, url, stopped_by)
+    except OSError as e:
+        print_error(f"Could not write {fmt} report: {e}")
+        return
+    print(f"📄 {fmt.upper()} report: {path}")
+
 def main():
     parser = argparse.ArgumentParser(
         description="Run complete Antigravity Kit verification suite",
@@ -268,14 +486,34 @@ def main():
 Examples:
   python scripts/verify_all.py . --url http://localhost:3000
   python scripts/verify_all.py . --url https://staging.example.com --no-e2e
+  python scripts/verify_all.py . --url http://localhost:3000 --jobs 0
+  python scripts/verify_all.py . --timings --runs 50 --slowdown 1.3
+  python scripts/verify_all.py . --url http://localhost:3000 --report json
         """
     )
     parser.add_argument("project", help="Project path to validate")
-    parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
+    parser.add_argument("--url", help="URL for performance & E2E checks (required unless --timings)")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Run up to N independent checks at once (0 = one per CPU)")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run every check in its own interpreter instead of warm in-process workers")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Rerun every check instead of replaying results whose inputs are unchanged")
+    parser.add_argument("--timings", action="store_true",
+                        help="Report p50/p95 per check from recorded runs instead of verifying; exits 1 on slowdowns")
+    parser.add_argument("--runs", type=int, default=20, help="--timings: recent runs per check to consider")
+    parser.add_argument("--slowdown", type=float, default=1.5,
+                        help="--timings: flag checks whose latest run took this many times their median")
+    parser.add_argument("--report", choices=REPORT_FORMATS,
+                        help="Also write a machine-readable report (durations, outputs, skip reasons) for CI")
+    parser.add_argument("--report-file", metavar="PATH",
+                        help="Where --report is written (default: .agent/.cache/verify_all-report.json / .xml)")
     
     args = parser.parse_args()
+    if not args.url and not args.timings:
+        parser.error("the following arguments are required: --url")
     
     project_path = Path(args.project).resolve()
     
@@ -283,15 +521,21 @@ Examples:
         print_error(f"Project path does not exist: {project_path}")
         sys.exit(1)
     
+    if args.timings:
+        sys.exit(0 if print_timings_report(project_path, max(1, args.runs), args.slowdown) else 1)
+    
+    # List the project's files once; the checks load this index instead of globbing
+    share_index(project_path)
+    
     print_header("🚀 ANTIGRAVITY KIT - FULL VERIFICATION SUITE")
     print(f"Project: {project_path}")
     print(f"URL: {args.url}")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     start_time = datetime.now()
-    results = []
+    checks = []
     
-    # Run all verification categories
+    # Collect all verification categories
     for suite in VERIFICATION_SUITE:
         category = suite["category"]
         requires_url = suite.get("requires_url", False)
@@ -304,22 +548,27 @@ Examples:
         if args.no_e2e and category == "E2E Testing":
             continue
         
-        print_header(f"📋 {category.upper()}")
-        
         for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+            checks.append({"name": name, "category": category, "script": project_path / script_path, "required": required})
+    
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    cache = None if args.no_cache else ResultCache(project_path, exclude=[args.report_file]).load()
+    results, stopped_by = run_checks(checks, str(project_path), args.url, jobs, args.stop_on_fail,
+                                     args.isolate, cache)
+    # Keep this run's per-check timings for --timings
+    record_run(project_path, results, start_time)
+    
+    if stopped_by:
+        print_error(f"CRITICAL: {stopped_by} failed. Stopping verification.")
+        print_final_report(results, start_time)
+        if args.report:
+            save_report(args.report, args.report_file, project_path, checks, results, start_time, args.url, stopped_by)
+        sys.exit(1)
     
     # Print final report
     all_passed = print_final_report(results, start_time)
+    if args.report:
+        save_report(args.report, args.report_file, project_path, checks, results, start_time, args.url, stopped_by)
     
     sys.exit(0 if all_passed else 1)
 
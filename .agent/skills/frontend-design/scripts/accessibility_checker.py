@@ -4,7 +4,7 @@ Accessibility Checker - WCAG compliance audit
 Checks HTML files for accessibility issues.
 
 Usage:
-    python accessibility_checker.py <project_path>
+    python accessibility_checker.py <project_path> [--changed-since <ref>]
 
 Checks:
     - Form labels
@@ -20,6 +20,11 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared helpers live in .agent/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from changed_files import GitDiffError, changed_files, pop_changed_since
+from project_index import load_index, read_text
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -27,16 +32,20 @@ except:
     pass
 
 
-def find_html_files(project_path: Path) -> list:
-    """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
+def find_html_files(project_path: Path, changed_since: str = None) -> list:
+    """Find all HTML/JSX/TSX files (only those changed since a git ref, if given)."""
+    extensions = ['.html', '.jsx', '.tsx']
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
     
+    if changed_since is not None:
+        files_in_scope = changed_files(project_path, changed_since, extensions)
+    else:
+        files_in_scope = load_index(project_path).files(*extensions)
+    
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
+    for f in files_in_scope:
+        if not any(skip in f.parts for skip in skip_dirs):
+            files.append(f)
     
     return files[:50]
 
@@ -46,7 +55,7 @@ def check_accessibility(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
         
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
@@ -108,8 +117,14 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    try:
+        changed_since = pop_changed_since(argv)
+    except GitDiffError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    project_path = Path(argv[0] if argv else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
@@ -119,7 +134,11 @@ def main():
     print("-"*60)
     
     # Find HTML files
-    files = find_html_files(project_path)
+    try:
+        files = find_html_files(project_path, changed_since)
+    except GitDiffError as e:
+        print(f"Error: --changed-since: {e}")
+        sys.exit(1)
     print(f"Found {len(files)} HTML/JSX/TSX files")
     
     if not files:
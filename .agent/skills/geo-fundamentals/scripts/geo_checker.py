@@ -14,13 +14,18 @@ WHAT IT CHECKS:
     - NOT markdown files (those are developer docs, not public content)
 
 Usage:
-    python geo_checker.py <project_path>
+    python geo_checker.py <project_path> [--changed-since <ref>]
 """
 import sys
 import re
 import json
 from pathlib import Path
 
+# Shared helpers live in .agent/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from changed_files import GitDiffError, changed_files, pop_changed_since
+from project_index import load_index, read_text
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -78,20 +83,24 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
-def find_web_pages(project_path: Path) -> list:
-    """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+def find_web_pages(project_path: Path, changed_since: str = None) -> list:
+    """Find public-facing web pages only (only those changed since a git ref, if given)."""
+    extensions = ['.html', '.htm', '.jsx', '.tsx']
+    
+    if changed_since is not None:
+        files_in_scope = changed_files(project_path, changed_since, extensions)
+    else:
+        files_in_scope = load_index(project_path).files(*extensions)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+    for f in files_in_scope:
+        # Skip excluded directories
+        if any(skip in f.parts for skip in SKIP_DIRS):
+            continue
+        
+        # Check if it's likely a page
+        if is_page_file(f):
+            files.append(f)
     
     return files[:30]  # Limit to 30 pages
 
@@ -99,7 +108,7 @@ def find_web_pages(project_path: Path) -> list:
 def check_page(file_path: Path) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
@@ -219,8 +228,14 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    try:
+        changed_since = pop_changed_since(argv)
+    except GitDiffError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    target = argv[0] if argv else "."
     target_path = Path(target).resolve()
     
     print("\n" + "=" * 60)
@@ -230,7 +245,11 @@ def main():
     print("-" * 60)
     
     # Find web pages only
-    pages = find_web_pages(target_path)
+    try:
+        pages = find_web_pages(target_path, changed_since)
+    except GitDiffError as e:
+        print(f"Error: --changed-since: {e}")
+        sys.exit(1)
     
     if not pages:
         print("\n[!] No public web pages found.")
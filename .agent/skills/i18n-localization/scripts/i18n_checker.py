@@ -2,11 +2,19 @@
 """
 i18n Checker - Detects hardcoded strings and missing translations.
 Scans for untranslated text in React, Vue, and Python files.
+
+Usage:
+    python i18n_checker.py <project_path> [--changed-since <ref>]
 """
 import sys
 import re
 import json
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+
+# Shared helpers live in .agent/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from changed_files import GitDiffError, changed_files, pop_changed_since
+from project_index import classify, load_index, read_text
 
 # Fix Windows console encoding for Unicode output
 try:
@@ -51,21 +59,12 @@ I18N_PATTERNS = [
 ]
 
 def find_locale_files(project_path: Path) -> list:
-    """Find translation/locale files."""
-    patterns = [
-        "**/locales/**/*.json",
-        "**/translations/**/*.json",
-        "**/lang/**/*.json",
-        "**/i18n/**/*.json",
-        "**/messages/*.json",
-        "**/*.po",  # gettext
-    ]
-    
-    files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
-    
-    return [f for f in files if 'node_modules' not in str(f)]
+    """Find translation/locale files (locales/, translations/, lang/, i18n/, messages/*.json, *.po)."""
+    return load_index(project_path).files(roles={'locale'})
+
+def is_locale_file(rel_path: Path) -> bool:
+    """Whether a project-relative path is one find_locale_files would return."""
+    return 'locale' in classify(PurePosixPath(rel_path.as_posix()))
 
 def check_locale_completeness(locale_files: list) -> dict:
     """Check if all locales have the same keys."""
@@ -128,8 +127,8 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
-def check_hardcoded_strings(project_path: Path) -> dict:
-    """Check for hardcoded strings in code files."""
+def check_hardcoded_strings(project_path: Path, changed: list = None) -> dict:
+    """Check for hardcoded strings in code files (only the changed ones, if given)."""
     issues = []
     passed = []
     
@@ -140,9 +139,10 @@ def check_hardcoded_strings(project_path: Path) -> dict:
         '.py': 'python'
     }
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+    if changed is not None:
+        code_files = [f for f in changed if f.suffix in extensions]
+    else:
+        code_files = load_index(project_path).files(*extensions)
     
     code_files = [f for f in code_files if not any(x in str(f) for x in 
                   ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
@@ -156,7 +156,7 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     for file_path in code_files[:50]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path)
             ext = file_path.suffix
             file_type = extensions.get(ext, 'jsx')
             
@@ -196,20 +196,37 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    try:
+        changed_since = pop_changed_since(argv)
+    except GitDiffError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    target = argv[0] if argv else "."
     project_path = Path(target)
+    # --changed-since: analyze only files touched since the git ref
+    changed = None
+    if changed_since is not None:
+        try:
+            changed = changed_files(project_path, changed_since)
+        except GitDiffError as e:
+            print(f"Error: --changed-since: {e}")
+            sys.exit(1)
     
     print("\n" + "=" * 60)
     print("  i18n CHECKER - Internationalization Audit")
     print("=" * 60 + "\n")
     
-    # Check locale files
-    locale_files = find_locale_files(project_path)
-    locale_result = check_locale_completeness(locale_files)
+    # Check locale files (locales are compared as a whole, so any changed one triggers the full check)
+    if changed is None or any(is_locale_file(f.relative_to(project_path)) for f in changed):
+        locale_files = find_locale_files(project_path)
+        locale_result = check_locale_completeness(locale_files)
+    else:
+        locale_result = {'passed': [f"[OK] No locale files changed since {changed_since}"], 'issues': []}
     
     # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
+    code_result = check_hardcoded_strings(project_path, changed)
     
     # Print results
     print("[LOCALE FILES]")
@@ -2,12 +2,20 @@
 """
 Type Coverage Checker - Measures TypeScript/Python type coverage.
 Identifies untyped functions, any usage, and type safety issues.
+
+Usage:
+    python type_coverage.py <project_path> [--changed-since <ref>]
 """
 import sys
 import re
 import subprocess
 from pathlib import Path
 
+# Shared helpers live in .agent/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from changed_files import GitDiffError, changed_files, pop_changed_since
+from project_index import load_index, read_text
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -15,13 +23,16 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def check_typescript_coverage(project_path: Path) -> dict:
-    """Check TypeScript type coverage."""
+def check_typescript_coverage(project_path: Path, changed: list = None) -> dict:
+    """Check TypeScript type coverage (only the changed files, if given)."""
     issues = []
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
+    if changed is not None:
+        ts_files = [f for f in changed if f.suffix in ('.ts', '.tsx')]
+    else:
+        ts_files = load_index(project_path).files('.ts', '.tsx')
     ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
     
     if not ts_files:
@@ -29,7 +40,7 @@ def check_typescript_coverage(project_path: Path) -> dict:
     
     for file_path in ts_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path)
             
             # Count 'any' usage
             any_matches = re.findall(r':\s*any\b', content)
@@ -71,13 +82,13 @@ def check_typescript_coverage(project_path: Path) -> dict:
     
     return {'type': 'typescript', 'files': len(ts_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def check_python_coverage(project_path: Path) -> dict:
-    """Check Python type hints coverage."""
+def check_python_coverage(project_path: Path, changed: list = None) -> dict:
+    """Check Python type hints coverage (only the changed files, if given)."""
     issues = []
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
+    py_files = [f for f in changed if f.suffix == '.py'] if changed is not None else load_index(project_path).files('.py')
     py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
     
     if not py_files:
@@ -85,7 +96,7 @@ def check_python_coverage(project_path: Path) -> dict:
     
     for file_path in py_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = read_text(file_path)
             
             # Count Any usage
             any_matches = re.findall(r':\s*Any\b', content)
@@ -125,9 +136,23 @@ def check_python_coverage(project_path: Path) -> dict:
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    try:
+        changed_since = pop_changed_since(argv)
+    except GitDiffError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    target = argv[0] if argv else "."
     project_path = Path(target)
+    # --changed-since: analyze only files touched since the git ref
+    changed = None
+    if changed_since is not None:
+        try:
+            changed = changed_files(project_path, changed_since)
+        except GitDiffError as e:
+            print(f"Error: --changed-since: {e}")
+            sys.exit(1)
     
     print("\n" + "=" * 60)
     print("  TYPE COVERAGE CHECKER")
@@ -136,12 +161,12 @@ def main():
     results = []
     
     # Check TypeScript
-    ts_result = check_typescript_coverage(project_path)
+    ts_result = check_typescript_coverage(project_path, changed)
     if ts_result['files'] > 0:
         results.append(ts_result)
     
     # Check Python
-    py_result = check_python_coverage(project_path)
+    py_result = check_python_coverage(project_path, changed)
     if py_result['files'] > 0:
         results.append(py_result)
     
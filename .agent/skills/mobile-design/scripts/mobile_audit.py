@@ -70,8 +70,19 @@ import os
 import re
 import json
 from pathlib import Path
+from typing import List, Optional
+
+# Shared helpers live in .agent/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from changed_files import GitDiffError, pop_changed_since
+from directory_audit import DirectoryAudit, pop_jobs
+from project_index import read_text
+
+
+class MobileAuditor(DirectoryAudit):
+    EXTENSIONS = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
+    SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', '.idea'}
 
-class MobileAuditor:
     def __init__(self):
         self.issues = []
         self.warnings = []
@@ -80,8 +91,7 @@ class MobileAuditor:
 
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            content = read_text(filepath, errors='replace')
         except:
             return
 
@@ -610,14 +620,6 @@ class MobileAuditor:
             # This is more of a configuration check, not code pattern
             self.passed_count += 1  # Hermes is default in RN 0.70+
 
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
-
     def get_report(self):
         return {
             "files_checked": self.files_checked,
@@ -628,19 +630,31 @@ class MobileAuditor:
         }
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python mobile_audit.py <directory>")
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    try:
+        changed_since = pop_changed_since(argv)
+        jobs = pop_jobs(argv)
+    except (GitDiffError, ValueError) as e:
+        print(f"Error: {e}")
         sys.exit(1)
 
-    path = sys.argv[1]
-    is_json = "--json" in sys.argv
+    if not argv:
+        print("Usage: python mobile_audit.py <directory> [--json] [--changed-since <ref>] [--jobs <n>]")
+        sys.exit(1)
+
+    path = argv[0]
+    is_json = "--json" in argv
 
     auditor = MobileAuditor()
-    if os.path.isfile(path):
-        auditor.audit_file(path)
-    else:
-        auditor.audit_directory(path)
+    try:
+        if os.path.isfile(path):
+            auditor.audit_file(path)
+        else:
+            auditor.audit_directory(path, changed_since, jobs)
+    except GitDiffError as e:
+        print(f"Error: --changed-since: {e}")
+        sys.exit(1)
 
     report = auditor.get_report()
 
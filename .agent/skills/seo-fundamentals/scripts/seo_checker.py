@@ -15,7 +15,7 @@ WHAT IT CHECKS:
     - Only files that are likely PUBLIC pages
 
 Usage:
-    python seo_checker.py <project_path>
+    python seo_checker.py <project_path> [--changed-since <ref>]
 """
 import sys
 import json
@@ -23,6 +23,11 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared helpers live in .agent/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from changed_files import GitDiffError, changed_files, pop_changed_since
+from project_index import load_index, read_text
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -75,20 +80,24 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
-def find_pages(project_path: Path) -> list:
-    """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+def find_pages(project_path: Path, changed_since: str = None) -> list:
+    """Find page files to check (only those changed since a git ref, if given)."""
+    extensions = ['.html', '.htm', '.jsx', '.tsx']
+    
+    if changed_since is not None:
+        files_in_scope = changed_files(project_path, changed_since, extensions)
+    else:
+        files_in_scope = load_index(project_path).files(*extensions)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+    for f in files_in_scope:
+        # Skip excluded directories
+        if any(skip in f.parts for skip in SKIP_DIRS):
+            continue
+        
+        # Check if it's likely a page
+        if is_page_file(f):
+            files.append(f)
     
     return files[:50]  # Limit to 50 files
 
@@ -98,7 +107,7 @@ def check_page(file_path: Path) -> dict:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
@@ -145,8 +154,14 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def main(argv: list = None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    try:
+        changed_since = pop_changed_since(argv)
+    except GitDiffError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    project_path = Path(argv[0] if argv else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"  SEO CHECKER - Search Engine Optimization Audit")
@@ -156,7 +171,11 @@ def main():
     print("-"*60)
     
     # Find pages
-    pages = find_pages(project_path)
+    try:
+        pages = find_pages(project_path, changed_since)
+    except GitDiffError as e:
+        print(f"Error: --changed-since: {e}")
+        sys.exit(1)
     
     if not pages:
         print("\n[!] No page files found.")
@@ -5,14 +5,31 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import hashlib
+import heapq
+import os
+import pickle
 import re
+import threading
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+
+# NumPy is optional and only imported once the vectorized backend is used
+np = None
+NUMPY_AVAILABLE = None  # unknown until _numpy_available() has run
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
+INDEX_DIR = Path(__file__).parent.parent / ".index"
+INDEX_VERSION = 3
+TABLE_CACHE_SIZE = 32  # parsed CSV tables kept per process
+RESULT_CACHE_SIZE = 512  # ranked query results kept per process
 MAX_RESULTS = 3
+# "python" scores through the inverted index; "numpy" uses a CSR term-document
+# matrix and falls back to "python" when NumPy is not installed
+BM25_BACKEND = "python"
+BATCH_QUERIES = 1024  # queries scored per vectorized chunk
 
 CSV_CONFIG = {
     "style": {
@@ -93,98 +110,476 @@ AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
 
 # ============ BM25 IMPLEMENTATION ============
+def tokenize(text):
+    """Lowercase, split, remove punctuation, filter short words"""
+    text = re.sub(r'[^\w\s]', ' ', str(text).lower())
+    return [w for w in text.split() if len(w) > 2]
+
+
+def _numpy_available():
+    global np, NUMPY_AVAILABLE
+    if NUMPY_AVAILABLE is None:
+        try:
+            import numpy
+            np = numpy
+            NUMPY_AVAILABLE = True
+        except ImportError:
+            NUMPY_AVAILABLE = False
+    return NUMPY_AVAILABLE
+
+
 class BM25:
     """BM25 ranking algorithm for text search"""
 
-    def __init__(self, k1=1.5, b=0.75):
+    def __init__(self, k1=1.5, b=0.75, backend=None):
         self.k1 = k1
         self.b = b
-        self.corpus = []
+        self.backend = backend
         self.doc_lengths = []
+        self.doc_norms = []
         self.avgdl = 0
         self.idf = {}
-        self.doc_freqs = defaultdict(int)
+        self.doc_freqs = {}
+        self.postings = {}
         self.N = 0
+        self._csr = None
+
+    def __getstate__(self):
+        # The CSR matrix is derived from the postings; keep indexes loadable without NumPy
+        state = self.__dict__.copy()
+        state["_csr"] = None
+        return state
 
     def tokenize(self, text):
         """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
+        return tokenize(text)
 
     def fit(self, documents):
         """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        corpus = [self.tokenize(doc) for doc in documents]
+        self.N = len(corpus)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
+        self.doc_lengths = [len(doc) for doc in corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
+        # Length normalisation part of the BM25 denominator, fixed per document
+        self.doc_norms = [self.k1 * (1 - self.b + self.b * doc_len / self.avgdl) for doc_len in self.doc_lengths]
 
-        for doc in self.corpus:
-            seen = set()
+        # Inverted index: term -> [(doc index, term frequency), ...] in document order
+        postings = defaultdict(list)
+        for idx, doc in enumerate(corpus):
+            term_freqs = defaultdict(int)
             for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+                term_freqs[word] += 1
+            for word, tf in term_freqs.items():
+                postings[word].append((idx, tf))
+        self.postings = dict(postings)
 
+        self.doc_freqs = {word: len(docs) for word, docs in self.postings.items()}
         for word, freq in self.doc_freqs.items():
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
-
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
+    def _use_numpy(self, backend):
+        return (backend or self.backend or BM25_BACKEND) == "numpy" and self.N > 0 and _numpy_available()
+
+    def score(self, query, top_k=None, backend=None):
+        """Score documents against query, best first"""
+        return self.score_tokens(self.tokenize(query), top_k, backend)
+
+    def score_batch(self, queries, top_k=None, backend=None):
+        """Score many queries at once; returns one ranking per query"""
+        token_lists = [self.tokenize(query) for query in queries]
+        if self._use_numpy(backend):
+            return self._score_numpy(token_lists, top_k)
+        return [self.score_tokens(tokens, top_k, "python") for tokens in token_lists]
+
+    def score_tokens(self, query_tokens, top_k=None, backend=None):
+        """
+        Score already-tokenized query against the index.
+
+        Only documents containing at least one query token are scored (and
+        returned); ties keep document order. With top_k, a heap selects the
+        best k instead of sorting every match.
+        """
+        if self._use_numpy(backend):
+            return self._score_numpy([query_tokens], top_k)[0]
+
+        scores = {}
+        k1_plus_1 = self.k1 + 1
+        for token in query_tokens:
+            docs = self.postings.get(token)
+            if not docs:
+                continue
+            idf = self.idf[token]
+            for idx, tf in docs:
+                numerator = tf * k1_plus_1
+                denominator = tf + self.doc_norms[idx]
+                scores[idx] = scores.get(idx, 0) + idf * numerator / denominator
+
+        if top_k is not None:
+            return heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    # ---- NumPy backend ----
+    def _build_csr(self):
+        """Term-document matrix in CSR form: one row per term, BM25 weight per (term, doc)"""
+        terms = list(self.postings)
+        term_ids = {term: row for row, term in enumerate(terms)}
+        lengths = np.fromiter((len(self.postings[term]) for term in terms), dtype=np.int64, count=len(terms))
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+
+        pairs = [pair for term in terms for pair in self.postings[term]]
+        indices = np.fromiter((idx for idx, _ in pairs), dtype=np.int64, count=len(pairs))
+        tfs = np.fromiter((tf for _, tf in pairs), dtype=np.float64, count=len(pairs))
+        idfs = np.repeat(np.fromiter((self.idf[term] for term in terms), dtype=np.float64, count=len(terms)), lengths)
+        norms = np.asarray(self.doc_norms, dtype=np.float64)[indices]
+        # Same operation order as score_tokens, so both backends agree bit for bit
+        data = idfs * (tfs * (self.k1 + 1)) / (tfs + norms)
+
+        self._csr = (term_ids, indptr, indices, data)
+        return self._csr
+
+    def _score_numpy(self, token_lists, top_k=None):
+        term_ids, indptr, indices, data = self._csr or self._build_csr()
+        rankings = []
+        for start in range(0, len(token_lists), BATCH_QUERIES):
+            batch = token_lists[start:start + BATCH_QUERIES]
+
+            # Gather the CSR rows of every (query, token) pair in one shot
+            query_ids, rows = [], []
+            for qi, tokens in enumerate(batch):
+                for token in tokens:
+                    row = term_ids.get(token)
+                    if row is not None:
+                        query_ids.append(qi)
+                        rows.append(row)
+            rows = np.asarray(rows, dtype=np.int64)
+            starts = indptr[rows]
+            lengths = indptr[rows + 1] - starts
+            offsets = np.arange(int(lengths.sum()), dtype=np.int64)
+            offsets += np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+
+            cells = np.repeat(np.asarray(query_ids, dtype=np.int64), lengths) * self.N + indices[offsets]
+            # Sum each (query, doc) cell in gather order, so totals match the Python backend
+            cells, inverse = np.unique(cells, return_inverse=True)
+            scores = np.bincount(inverse.ravel(), weights=data[offsets], minlength=len(cells))
+            rankings.extend(self._rank_cells(cells, scores, len(batch), top_k))
+        return rankings
+
+    def _rank_cells(self, cells, scores, n_queries, top_k):
+        """Turn sparse (query, doc) scores into per-query rankings"""
+        query_ids, docs = np.divmod(cells, self.N)
+        # Group by query, best score first, ties in document order
+        order = np.lexsort((docs, -scores, query_ids))
+        query_ids, docs, scores = query_ids[order], docs[order], scores[order]
+
+        bounds = np.searchsorted(query_ids, np.arange(n_queries + 1))
+        if top_k is not None:
+            ends = np.minimum(bounds[1:], bounds[:-1] + max(top_k, 0))
+        else:
+            ends = bounds[1:]
+        docs, scores = docs.tolist(), scores.tolist()
+        return [list(zip(docs[lo:hi], scores[lo:hi])) for lo, hi in zip(bounds[:-1].tolist(), ends.tolist())]
+
+
+# ============ PREBUILT INDEXES ============
+class SearchIndex:
+    """Fitted BM25 model plus the output payload of every row of one CSV"""
+
+    def __init__(self, bm25, columns, rows, signature, stamp, digest):
+        self.bm25 = bm25
+        self.columns = columns      # output columns present in the CSV header
+        self.rows = rows            # one tuple per CSV row, aligned with columns
+        self.signature = signature  # invalidates the index when the config changes
+        self.stamp = stamp          # (mtime_ns, size) of the source CSV
+        self.digest = digest        # sha1 of the source CSV
+
+    def result(self, idx):
+        """Return the output payload of a row as a dict"""
+        return dict(zip(self.columns, self.rows[idx]))
+
+
+# In-process indexes, keyed by source CSV path
+_INDEXES = {}
+
+
+def _file_stamp(filepath):
+    stat = filepath.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _file_digest(filepath):
+    with open(filepath, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _index_signature(search_cols, output_cols):
+    return (INDEX_VERSION, tuple(search_cols), tuple(output_cols))
+
+
+def _index_path(filepath):
+    """Map a CSV under DATA_DIR to its index file (stacks/react.csv -> stacks__react.idx)"""
+    try:
+        name = filepath.relative_to(DATA_DIR).with_suffix("").as_posix().replace("/", "__")
+    except ValueError:
+        name = hashlib.sha1(str(filepath).encode("utf-8")).hexdigest()
+    return INDEX_DIR / f"{name}.idx"
+
+
+def _read_index(index_path):
+    try:
+        with open(index_path, 'rb') as f:
+            index = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    return index if isinstance(index, SearchIndex) else None
+
+
+def _write_index(index_path, index):
+    """Atomically write an index; a read-only skill directory just means no persistence"""
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _build_index(filepath, search_cols, output_cols, stamp):
+    """Tokenize and fit a CSV from scratch"""
+    table = load_table(filepath)
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
-
-            scores.append((idx, score))
+    # Build documents from search columns
+    documents = [" ".join(str(table.get(row, col)) for col in search_cols) for row in table.rows]
+    bm25 = BM25()
+    bm25.fit(documents)
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+    columns = tuple(col for col in output_cols if col in table.columns)
+    positions = [table.columns[col] for col in columns]
+    rows = [tuple(row[pos] for pos in positions) for row in table.rows]
+
+    return SearchIndex(bm25, columns, rows, _index_signature(search_cols, output_cols),
+                       stamp, _file_digest(filepath))
+
+
+def load_index(filepath, search_cols, output_cols, rebuild=False):
+    """
+    Return the BM25 index for a CSV, building it only when needed.
+
+    Lookup order: in-process cache, then the on-disk index in INDEX_DIR, then a
+    fresh fit. An index is reused while the CSV's mtime/size match; when they
+    differ the content hash decides whether a rebuild is actually required.
+    """
+    filepath = Path(filepath)
+    stamp = _file_stamp(filepath)
+    signature = _index_signature(search_cols, output_cols)
+
+    index = None if rebuild else _INDEXES.get(filepath)
+    if index is not None and index.signature == signature and index.stamp == stamp:
+        return index
+
+    index_path = _index_path(filepath)
+    index = None if rebuild else _read_index(index_path)
+    if index is not None and index.signature != signature:
+        index = None
+    if index is not None and index.stamp != stamp:
+        if index.digest == _file_digest(filepath):
+            # Touched but unchanged (e.g. fresh checkout): refresh the stamp only
+            index.stamp = stamp
+            _write_index(index_path, index)
+        else:
+            index = None
+
+    if index is None:
+        index = _build_index(filepath, search_cols, output_cols, stamp)
+        _write_index(index_path, index)
+
+    _INDEXES[filepath] = index
+    _RESULTS.invalidate(filepath)  # cached rankings belong to the index being replaced
+    return index
+
+
+def build_indexes(force=False, domains=None):
+    """Prebuild (and load) the index of every domain and stack CSV, or only the given domains"""
+    targets = [(domain, DATA_DIR / config["file"], config["search_cols"], config["output_cols"])
+               for domain, config in CSV_CONFIG.items() if domains is None or domain in domains]
+    if domains is None:
+        targets += [(f"stack:{stack}", DATA_DIR / config["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"])
+                    for stack, config in STACK_CONFIG.items()]
+
+    built = []
+    for name, filepath, search_cols, output_cols in targets:
+        if not filepath.exists():
+            continue
+        index = load_index(filepath, search_cols, output_cols, rebuild=force)
+        built.append({"name": name, "file": str(filepath), "documents": index.bm25.N})
+    return built
+
+
+# ============ TABLE CACHE ============
+class Table:
+    """Parsed CSV: one shared header plus a tuple per row"""
+
+    __slots__ = ("header", "columns", "rows")
+
+    def __init__(self, header, rows):
+        self.header = tuple(header)
+        # column name -> position (a repeated name maps to its last column, like csv.DictReader)
+        self.columns = {col: pos for pos, col in enumerate(self.header)}
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get(self, row, col, default=""):
+        """Value of col in row, or default when the CSV has no such column"""
+        pos = self.columns.get(col)
+        return default if pos is None else row[pos]
+
+    def as_dict(self, row):
+        return {col: row[pos] for col, pos in self.columns.items()}
+
+    def dicts(self):
+        """Rows as dicts, the shape csv.DictReader would produce"""
+        return [self.as_dict(row) for row in self.rows]
+
+
+# Process-wide LRU of parsed tables: path -> ((mtime_ns, size), Table)
+_TABLES = OrderedDict()
+_TABLES_LOCK = threading.Lock()
+
+
+def load_table(filepath):
+    """
+    Read a CSV through the process-wide table cache.
+
+    Every ui-ux-pro-max module reads its CSVs here, so each file is parsed at
+    most once per process (again only if its mtime/size change).
+    """
+    filepath = Path(filepath)
+    stamp = _file_stamp(filepath)
+    with _TABLES_LOCK:
+        cached = _TABLES.get(filepath)
+        if cached is not None and cached[0] == stamp:
+            _TABLES.move_to_end(filepath)
+            return cached[1]
+
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        width = len(header)
+        # Short rows are padded with None, as csv.DictReader does
+        rows = [tuple(row[:width]) if len(row) >= width else tuple(row) + (None,) * (width - len(row))
+                for row in reader if row]
+    table = Table(header, rows)
+
+    with _TABLES_LOCK:
+        _TABLES[filepath] = (stamp, table)
+        _TABLES.move_to_end(filepath)
+        while len(_TABLES) > TABLE_CACHE_SIZE:
+            _TABLES.popitem(last=False)
+    return table
+
+
+# ============ RESULT CACHE ============
+class ResultCache:
+    """Bounded LRU of search results with hit/miss/eviction counters"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, filepath):
+        """Drop every entry computed against filepath's index"""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == filepath]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize
+            }
+
+
+_RESULTS = ResultCache(RESULT_CACHE_SIZE)
+
+
+def _ranked_results(filepath, index, tokens, max_results):
+    """Top results for already-tokenized query, served from the result cache when possible"""
+    # Tokens are the normalized query: case, punctuation and short words don't split the cache
+    key = (filepath, tuple(tokens), max_results)
+    results = _RESULTS.get(key)
+    if results is None:
+        results = tuple(index.result(idx) for idx, score in index.bm25.score_tokens(tokens, top_k=max_results))
+        _RESULTS.put(key, results)
+    # Hand out copies so callers can't mutate the cached rows
+    return [dict(row) for row in results]
+
+
+def cache_stats():
+    """Counters of the in-process caches (reported by search.py --stats)"""
+    return {"results": _RESULTS.stats(), "indexes": len(_INDEXES), "tables": len(_TABLES)}
 
 
 # ============ SEARCH FUNCTIONS ============
 def _load_csv(filepath):
     """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+    return load_table(filepath).dicts()
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
+def _search_csv_batch(filepath, search_cols, output_cols, queries, max_results, backend=None):
+    """Rank many queries against one CSV in a single scoring pass"""
     if not filepath.exists():
-        return []
-
-    data = _load_csv(filepath)
+        return [[] for _ in queries]
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    index = load_index(filepath, search_cols, output_cols)
+    rankings = index.bm25.score_batch(queries, top_k=max_results, backend=backend)
+    return [[index.result(idx) for idx, score in ranked] for ranked in rankings]
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
 
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
+def _search_csv(filepath, search_cols, output_cols, query, max_results):
+    """Core search function using BM25"""
+    if not filepath.exists():
+        return []
 
-    return results
+    index = load_index(filepath, search_cols, output_cols)
+    return _ranked_results(filepath, index, tokenize(query), max_results)
 
 
 def detect_domain(query):
@@ -231,6 +626,48 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     }
 
 
+def search_multi(query, domains, extra_queries=None):
+    """
+    Search several domains in one pass, tokenizing the query only once.
+
+    Args:
+        query: Search query shared by every domain
+        domains: Mapping of domain -> max_results
+        extra_queries: Optional mapping of domain -> text appended to the query
+            for that domain only (e.g. style priority hints)
+
+    Returns:
+        dict of domain -> result, each shaped like search()'s return value
+    """
+    extra_queries = extra_queries or {}
+    base_tokens = tokenize(query)
+    results = {}
+
+    for domain, max_results in domains.items():
+        config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            results[domain] = {"error": f"File not found: {filepath}", "domain": domain}
+            continue
+
+        domain_query, tokens = query, base_tokens
+        if extra_queries.get(domain):
+            domain_query = f"{query} {extra_queries[domain]}"
+            tokens = base_tokens + tokenize(extra_queries[domain])
+
+        index = load_index(filepath, config["search_cols"], config["output_cols"])
+        domain_results = _ranked_results(filepath, index, tokens, max_results)
+        results[domain] = {
+            "domain": domain,
+            "query": domain_query,
+            "file": config["file"],
+            "count": len(domain_results),
+            "results": domain_results
+        }
+
+    return results
+
+
 def search_stack(query, stack, max_results=MAX_RESULTS):
     """Search stack-specific guidelines"""
     if stack not in STACK_CONFIG:
@@ -251,3 +688,32 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def search_batch(queries, domain, max_results=MAX_RESULTS, backend="numpy"):
+    """
+    Search many queries against one domain (or "stack:<name>") at once.
+
+    Uses the vectorized NumPy backend when available, which is what makes bulk
+    relevance evaluations practical; results match search() query for query.
+    """
+    if domain.startswith("stack:"):
+        stack = domain.split(":", 1)[1]
+        if stack not in STACK_CONFIG:
+            return [{"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"} for _ in queries]
+        file = STACK_CONFIG[stack]["file"]
+        search_cols, output_cols = _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]
+        extra = {"domain": "stack", "stack": stack}
+    else:
+        config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
+        file = config["file"]
+        search_cols, output_cols = config["search_cols"], config["output_cols"]
+        extra = {"domain": domain}
+
+    filepath = DATA_DIR / file
+    if not filepath.exists():
+        return [{"error": f"File not found: {filepath}", **extra} for _ in queries]
+
+    batches = _search_csv_batch(filepath, search_cols, output_cols, queries, max_results, backend)
+    return [{**extra, "query": query, "file": file, "count": len(results), "results": results}
+            for query, results in zip(queries, batches)]
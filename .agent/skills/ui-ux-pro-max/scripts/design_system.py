@@ -11,14 +11,17 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+
+    # Bulk: many projects and pages in one run (see load_manifest for the format)
+    results = generate_design_systems_bulk(load_manifest("projects.json"), output_dir="out")
 """
 
-import csv
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import build_indexes, load_table, search_multi, DATA_DIR
 
 
 # ============ CONFIGURATION ============
@@ -39,73 +42,121 @@ class DesignSystemGenerator:
 
     def __init__(self):
         self.reasoning_data = self._load_reasoning()
+        self._build_reasoning_index()
 
     def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
+        """Load reasoning rules from CSV (through the shared table cache)."""
         filepath = DATA_DIR / REASONING_FILE
         if not filepath.exists():
             return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
-
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
-        for domain, config in SEARCH_CONFIG.items():
-            if domain == "style" and style_priority:
-                # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
-            else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
-
-    def _find_reasoning_rule(self, category: str) -> dict:
-        """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
-
+        return load_table(filepath).dicts()
+
+    def _multi_domain_search(self, query: str, style_priority: list = None, domains: list = None) -> dict:
+        """Execute searches across multiple domains in a single pass."""
+        domains = domains or list(SEARCH_CONFIG)
+        extra_queries = {}
+        if "style" in domains and style_priority:
+            # For style, also search with priority keywords
+            extra_queries["style"] = " ".join(style_priority[:2])
+        return search_multi(query, {domain: SEARCH_CONFIG[domain]["max_results"] for domain in domains}, extra_queries)
+
+    def _build_reasoning_index(self) -> None:
+        """
+        Precompute lookup structures over the reasoning rules.
+
+        The partial and keyword passes are substring tests, so candidates are
+        found through a trigram index (a substring's trigrams are a subset of the
+        containing string's) and then verified; strings shorter than a trigram
+        are always checked directly.
+        """
+        self._categories = [rule.get("UI_Category", "").lower() for rule in self.reasoning_data]
+        self._exact_rules = {}
+        for idx, ui_cat in enumerate(self._categories):
+            self._exact_rules.setdefault(ui_cat, idx)
+
+        self._category_grams, self._category_gram_counts, self._short_categories = \
+            self._index_grams(enumerate(self._categories))
+
+        self._keywords = [(kw, idx) for idx, ui_cat in enumerate(self._categories)
+                          for kw in ui_cat.replace("/", " ").replace("-", " ").split()]
+        self._keyword_grams, self._keyword_gram_counts, self._short_keywords = \
+            self._index_grams((kw_id, kw) for kw_id, (kw, _) in enumerate(self._keywords))
+
+        self._parsed_rules = [self._parse_rule(rule) for rule in self.reasoning_data]
+        self._rule_cache = {}
+
+    @staticmethod
+    def _grams(text: str) -> set:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def _index_grams(self, items) -> tuple:
+        """Return (trigram -> ids, id -> trigram count, ids too short to index)."""
+        postings, counts, short = {}, {}, []
+        for item_id, text in items:
+            grams = self._grams(text)
+            if not grams:
+                short.append(item_id)
+                continue
+            counts[item_id] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(item_id)
+        return postings, counts, short
+
+    @staticmethod
+    def _contained_ids(grams: set, postings: dict, counts: dict) -> list:
+        """Ids whose every trigram occurs in grams (candidates for 'text in query')."""
+        hits = {}
+        for gram in grams:
+            for item_id in postings.get(gram, ()):
+                hits[item_id] = hits.get(item_id, 0) + 1
+        return [item_id for item_id, n in hits.items() if n == counts[item_id]]
+
+    def _find_reasoning_rule_index(self, category_lower: str) -> int:
+        """Index of the matching rule (same precedence as a linear scan), or -1."""
         # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
+        if category_lower in self._exact_rules:
+            return self._exact_rules[category_lower]
 
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+        grams = self._grams(category_lower)
 
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
+        # Try partial match: rule category inside the category, or the other way round
+        candidates = self._contained_ids(grams, self._category_grams, self._category_gram_counts)
+        candidates += self._short_categories
+        if grams:
+            containing = set.intersection(*(set(self._category_grams.get(gram, ())) for gram in grams))
+        else:
+            containing = range(len(self._categories))
+        candidates += containing
+        matches = [idx for idx in candidates
+                   if self._categories[idx] in category_lower or category_lower in self._categories[idx]]
+        if matches:
+            return min(matches)
 
-        return {}
+        # Try keyword match
+        candidates = self._contained_ids(grams, self._keyword_grams, self._keyword_gram_counts)
+        candidates += self._short_keywords
+        matches = [self._keywords[kw_id][1] for kw_id in candidates if self._keywords[kw_id][0] in category_lower]
+        return min(matches) if matches else -1
 
-    def _apply_reasoning(self, category: str, search_results: dict) -> dict:
-        """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
+    def _rule_index(self, category: str) -> int:
+        """Memoized category -> rule index lookup."""
+        category_lower = category.lower()
+        if category_lower not in self._rule_cache:
+            self._rule_cache[category_lower] = self._find_reasoning_rule_index(category_lower)
+        return self._rule_cache[category_lower]
 
-        if not rule:
-            return {
-                "pattern": "Hero + Features + CTA",
-                "style_priority": ["Minimalism", "Flat Design"],
-                "color_mood": "Professional",
-                "typography_mood": "Clean",
-                "key_effects": "Subtle hover transitions",
-                "anti_patterns": "",
-                "decision_rules": {},
-                "severity": "MEDIUM"
-            }
+    def _find_reasoning_rule(self, category: str) -> dict:
+        """Find matching reasoning rule for a category."""
+        idx = self._rule_index(category)
+        return self.reasoning_data[idx] if idx >= 0 else {}
 
+    def _parse_rule(self, rule: dict) -> dict:
+        """Turn a reasoning CSV row into the reasoning dict used by generate()."""
         # Parse decision rules JSON
         decision_rules = {}
         try:
             decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, TypeError):
             pass
 
         return {
@@ -119,6 +170,27 @@ class DesignSystemGenerator:
             "severity": rule.get("Severity", "MEDIUM")
         }
 
+    def _apply_reasoning(self, category: str, search_results: dict) -> dict:
+        """Apply reasoning rules to search results."""
+        idx = self._rule_index(category)
+
+        if idx < 0:
+            return {
+                "pattern": "Hero + Features + CTA",
+                "style_priority": ["Minimalism", "Flat Design"],
+                "color_mood": "Professional",
+                "typography_mood": "Clean",
+                "key_effects": "Subtle hover transitions",
+                "anti_patterns": "",
+                "decision_rules": {},
+                "severity": "MEDIUM"
+            }
+
+        # Copy the mutable parts so callers can't alter the precomputed rule
+        parsed = self._parsed_rules[idx]
+        return {**parsed, "style_priority": list(parsed["style_priority"]),
+                "decision_rules": dict(parsed["decision_rules"])}
+
     def _select_best_match(self, results: list, priority_keywords: list) -> dict:
         """Select best matching result based on priority keywords."""
         if not results:
@@ -162,8 +234,9 @@ class DesignSystemGenerator:
 
     def generate(self, query: str, project_name: str = None) -> dict:
         """Generate complete design system recommendation."""
-        # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
+        # Step 1: Search every domain that doesn't depend on reasoning (product gives the category)
+        search_results = self._multi_domain_search(query, domains=[d for d in SEARCH_CONFIG if d != "style"])
+        product_result = search_results["product"]
         product_results = product_result.get("results", [])
         category = "General"
         if product_results:
@@ -173,9 +246,8 @@ class DesignSystemGenerator:
         reasoning = self._apply_reasoning(category, {})
         style_priority = reasoning.get("style_priority", [])
 
-        # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
+        # Step 3: Style search with style priority hints
+        search_results.update(self._multi_domain_search(query, style_priority, domains=["style"]))
 
         # Step 4: Select best matches from each domain using priority
         style_results = self._extract_results(search_results.get("style", {}))
@@ -460,7 +532,8 @@ def format_markdown(design_system: dict) -> str:
 
 # ============ MAIN ENTRY POINT ============
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
-                           persist: bool = False, page: str = None, output_dir: str = None) -> str:
+                           persist: bool = False, page: str = None, output_dir: str = None,
+                           generator: "DesignSystemGenerator" = None) -> str:
     """
     Main entry point for design system generation.
 
@@ -471,11 +544,12 @@ def generate_design_system(query: str, project_name: str = None, output_format:
         persist: If True, save design system to design-system/ folder
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
+        generator: Optional generator to reuse (keeps reasoning rules loaded across calls)
 
     Returns:
         Formatted design system string
     """
-    generator = DesignSystemGenerator()
+    generator = generator or DesignSystemGenerator()
     design_system = generator.generate(query, project_name)
     
     # Persist to files if requested
@@ -488,7 +562,8 @@ def generate_design_system(query: str, project_name: str = None, output_format:
 
 
 # ============ PERSISTENCE FUNCTIONS ============
-def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
+def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None,
+                          pages: list = None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
     
@@ -497,17 +572,14 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
+        pages: Optional further pages, as names or {"name": ..., "query": ...} dicts
+            (a page without its own query uses page_query)
     
     Returns:
         dict with created file paths and status
     """
-    base_dir = Path(output_dir) if output_dir else Path.cwd()
-    
     # Use project name for project-specific folder
-    project_name = design_system.get("project_name", "default")
-    project_slug = project_name.lower().replace(' ', '-')
-    
-    design_system_dir = base_dir / "design-system" / project_slug
+    design_system_dir = design_system_path(design_system.get("project_name", "default"), output_dir)
     pages_dir = design_system_dir / "pages"
     
     created_files = []
@@ -524,10 +596,17 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         f.write(master_content)
     created_files.append(str(master_file))
     
-    # If page is specified, create page override file with intelligent content
-    if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
+    # If pages are specified, create page override files with intelligent content
+    page_specs = [(page, page_query)] if page else []
+    for entry in pages or []:
+        if isinstance(entry, dict):
+            page_specs.append((entry["name"], entry.get("query") or page_query))
+        else:
+            page_specs.append((entry, page_query))
+
+    for page_name, query in page_specs:
+        page_file = pages_dir / f"{page_name.lower().replace(' ', '-')}.md"
+        page_content = format_page_override_md(design_system, page_name, query)
         with open(page_file, 'w', encoding='utf-8') as f:
             f.write(page_content)
         created_files.append(str(page_file))
@@ -539,6 +618,133 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
     }
 
 
+def design_system_path(project_name: str, output_dir: str = None) -> Path:
+    """design-system/<project slug>/ under output_dir (defaults to current working directory)."""
+    base_dir = Path(output_dir) if output_dir else Path.cwd()
+    return base_dir / "design-system" / project_name.lower().replace(' ', '-')
+
+
+# ============ BULK GENERATION ============
+def load_manifest(path: str) -> list:
+    """
+    Load a bulk manifest: a JSON list of projects, or {"projects": [...]}.
+
+    Each project is {"query": ..., "project_name": ..., "pages": [...], "output_dir": ...};
+    pages are names or {"name": ..., "query": ...} dicts. Raises ValueError when
+    the manifest is not such a list; bad entries are reported per project by
+    generate_design_systems_bulk.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    projects = manifest.get("projects") if isinstance(manifest, dict) else manifest
+    if not isinstance(projects, list):
+        raise ValueError('manifest must be a list of projects or {"projects": [...]}')
+    return projects
+
+
+def _project_error(project):
+    """Why a manifest entry cannot be generated, or None."""
+    if not isinstance(project, dict):
+        return f"project must be an object, got {type(project).__name__}"
+    if not isinstance(project.get("query"), str) or not project["query"].strip():
+        return "query must be a non-empty string"
+    for key in ("project_name", "output_dir"):
+        if project.get(key) is not None and not isinstance(project[key], str):
+            return f"{key} must be a string"
+    pages = project.get("pages", [])
+    if not isinstance(pages, list):
+        return "pages must be a list"
+    for page in pages:
+        if isinstance(page, dict):
+            if not isinstance(page.get("name"), str):
+                return "page name must be a string"
+            if page.get("query") is not None and not isinstance(page["query"], str):
+                return "page query must be a string"
+        elif not isinstance(page, str):
+            return "pages must be names or {\"name\": ..., \"query\": ...} objects"
+    return None
+
+
+def _project_label(project) -> str:
+    """Name to report a manifest entry under, whatever its shape."""
+    if isinstance(project, dict):
+        return str(project.get("project_name") or project.get("query") or "")
+    return ""
+
+
+# Worker state: one generator per process, so reasoning rules load once per worker
+_bulk_generator = None
+
+
+def _generate_project(task: tuple) -> dict:
+    """Generate and persist one manifest project (runs in a worker process)."""
+    global _bulk_generator
+    project, output_dir = task
+    try:
+        if _bulk_generator is None:
+            _bulk_generator = DesignSystemGenerator()
+        query = project["query"]
+        design_system = _bulk_generator.generate(query, project.get("project_name"))
+        result = persist_design_system(design_system, output_dir=project.get("output_dir") or output_dir,
+                                       page_query=query, pages=project.get("pages", []))
+        return {"project_name": design_system["project_name"], **result}
+    except Exception as e:
+        # One project's failure is its own error entry, never the whole run's
+        return {"project_name": _project_label(project), "status": "error", "error": f"{type(e).__name__}: {e}"}
+
+
+def generate_design_systems_bulk(projects: list, output_dir: str = None, jobs: int = None) -> list:
+    """
+    Generate and persist design systems for many projects in one run.
+
+    Generation is pure-Python CPU work, so projects are spread over a process
+    pool; each worker loads the reasoning rules once and inherits the search
+    indexes warmed here (where processes are forked).
+
+    Args:
+        projects: Manifest entries (see load_manifest)
+        output_dir: Default output directory for projects without their own
+        jobs: Worker processes (defaults to min(8, CPU count)); 1 runs in-process
+
+    Returns:
+        One persist_design_system() result per project, in manifest order,
+        with "project_name" added ("status": "error" and "error" on failure).
+        Invalid entries, and entries that would write the same design-system
+        directory as an earlier one, are errors and are not generated.
+    """
+    results = [None] * len(projects)
+    claimed = {}  # design-system directory -> manifest position that writes it
+    tasks, positions = [], []
+    for position, project in enumerate(projects):
+        error = _project_error(project)
+        if error is None:
+            name = project.get("project_name") or project["query"].upper()
+            target = design_system_path(name, project.get("output_dir") or output_dir).resolve()
+            if target in claimed:
+                error = f"same output directory as project #{claimed[target] + 1}: {target}"
+            else:
+                claimed[target] = position
+        if error is not None:
+            results[position] = {"project_name": _project_label(project) or f"#{position + 1}",
+                                 "status": "error", "error": error}
+        else:
+            tasks.append((project, output_dir))
+            positions.append(position)
+
+    if tasks:
+        # Load the indexes used by generation and page overrides before fanning out
+        build_indexes(domains=[*SEARCH_CONFIG, "ux"])
+    jobs = min(jobs or min(8, os.cpu_count() or 1), len(tasks))
+    if jobs <= 1:
+        generated = [_generate_project(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            generated = list(executor.map(_generate_project, tasks))
+    for position, result in zip(positions, generated):
+        results[position] = result
+    return results
+
+
 def format_master_md(design_system: dict) -> str:
     """Format design system as MASTER.md with hierarchical override logic."""
     project = design_system.get("project_name", "PROJECT")
@@ -918,21 +1124,17 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
     page_lower = page_name.lower()
     query_lower = (page_query or "").lower()
     combined_context = f"{page_lower} {query_lower}"
     
-    # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
+    # Search across multiple domains for page-specific guidance (one pass)
+    searches = search_multi(combined_context, {"style": 1, "ux": 3, "landing": 1})
     
     # Extract results from search response
-    style_results = style_search.get("results", [])
-    ux_results = ux_search.get("results", [])
-    landing_results = landing_search.get("results", [])
+    style_results = searches["style"].get("results", [])
+    ux_results = searches["ux"].get("results", [])
+    landing_results = searches["landing"].get("results", [])
     
     # Detect page type from search results or context
     page_type = _detect_page_type(combined_context, style_results)
@@ -1,114 +1,304 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
-Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
-       python search.py "<query>" --design-system [-p "Project Name"]
-       python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
-
-Domains: style, prompt, color, chart, landing, product, ux, typography
-Stacks: html-tailwind, react, nextjs
-
-Persistence (Master + Overrides pattern):
-  --persist    Save design system to design-system/MASTER.md
-  --page       Also create a page-specific override file in design-system/pages/
-"""
-
-import argparse
-import sys
-import io
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
-
-# Force UTF-8 for stdout/stderr to handle emojis on Windows (cp1252 default)
-if sys.stdout.encoding and sys.stdout.encoding.lower() != 'utf-8':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-if sys.stderr.encoding and sys.stderr.encoding.lower() != 'utf-8':
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
-
-
-def format_output(result):
-    """Format results for Claude consumption (token-optimized)"""
-    if "error" in result:
-        return f"Error: {result['error']}"
-
-    output = []
-    if result.get("stack"):
-        output.append(f"## UI Pro Max Stack Guidelines")
-        output.append(f"**Stack:** {result['stack']} | **Query:** {result['query']}")
-    else:
-        output.append(f"## UI Pro Max Search Results")
-        output.append(f"**Domain:** {result['domain']} | **Query:** {result['query']}")
-    output.append(f"**Source:** {result['file']} | **Found:** {result['count']} results\n")
-
-    for i, row in enumerate(result['results'], 1):
-        output.append(f"### Result {i}")
-        for key, value in row.items():
-            value_str = str(value)
-            if len(value_str) > 300:
-                value_str = value_str[:300] + "..."
-            output.append(f"- **{key}:** {value_str}")
-        output.append("")
-
-    return "\n".join(output)
-
-
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
-    parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
-    parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
-    parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
-    parser.add_argument("--json", action="store_true", help="Output as JSON")
-    # Design system generation
-    parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
-    parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
-    parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
-    # Persistence (Master + Overrides pattern)
-    parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
-    parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
-    parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
-
-    args = parser.parse_args()
-
-    # Design system takes priority
-    if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
-            args.format,
-            persist=args.persist,
-            page=args.page,
-            output_dir=args.output_dir
-        )
-        print(result)
-        
-        # Print persistence confirmation
-        if args.persist:
-            project_slug = args.project_name.lower().replace(' ', '-') if args.project_name else "default"
-            print("\n" + "=" * 60)
-            print(f"✅ Design system persisted to design-system/{project_slug}/")
-            print(f"   📄 design-system/{project_slug}/MASTER.md (Global Source of Truth)")
-            if args.page:
-                page_filename = args.page.lower().replace(' ', '-')
-                print(f"   📄 design-system/{project_slug}/pages/{page_filename}.md (Page Overrides)")
-            print("")
-            print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
-            print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
-            print("=" * 60)
-    # Stack search
-    elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
-    # Domain search
-    else:
-        result = search(args.query, args.domain, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
+Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
+       python search.py "<query>" --design-system [-p "Project Name"]
+       python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py --build-index [--rebuild]
+       python search.py --batch queries.txt|- [--domain <domain>] [--stack <stack>] [-n 3]
+       python search.py --bulk projects.json [--jobs 8] [-o out/]
+       python search.py --serve [--socket PATH]
+       python search.py "<query>" --use-daemon [...]
+
+Domains: style, prompt, color, chart, landing, product, ux, typography
+Stacks: html-tailwind, react, nextjs
+
+Persistence (Master + Overrides pattern):
+  --persist    Save design system to design-system/MASTER.md
+  --page       Also create a page-specific override file in design-system/pages/
+
+Indexes:
+  Each CSV is tokenized and fitted once, then cached in .index/ and reused until
+  the CSV changes. --build-index prebuilds all of them (--rebuild forces a refit).
+
+Bulk design systems:
+  --bulk       Generate and persist MASTER.md + page overrides for every project in a
+               JSON manifest: [{"query": ..., "project_name": ..., "pages": [...]}]
+
+Batch mode:
+  --batch      Read one query per line (plain text, or JSON with query/domain/stack/
+               max_results) from a file or stdin ("-") and stream JSONL results.
+               Indexes are loaded once for the whole batch. A bad line gets a
+               {"line": n, "error": ...} result and the batch goes on.
+
+Caching:
+  Ranked results are kept in an in-process LRU keyed on the normalized query tokens;
+  --stats prints its hit/miss/eviction counters (the daemon's with --use-daemon).
+
+Daemon (see search_daemon.py):
+  --serve       Keep every index warm and answer requests on a Unix socket
+  --use-daemon  Send this request to the daemon if one is running, else run locally
+                (errors reported by the daemon are shown, not retried locally)
+"""
+
+import argparse
+import json
+import os
+import sys
+import io
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, build_indexes, cache_stats
+from search_daemon import DaemonError, handle, request, serve
+
+# Force UTF-8 for stdout/stderr to handle emojis on Windows (cp1252 default)
+if sys.stdout.encoding and sys.stdout.encoding.lower() != 'utf-8':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+if sys.stderr.encoding and sys.stderr.encoding.lower() != 'utf-8':
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+
+def format_output(result):
+    """Format results for Claude consumption (token-optimized)"""
+    if "error" in result:
+        return f"Error: {result['error']}"
+
+    output = []
+    if result.get("stack"):
+        output.append(f"## UI Pro Max Stack Guidelines")
+        output.append(f"**Stack:** {result['stack']} | **Query:** {result['query']}")
+    else:
+        output.append(f"## UI Pro Max Search Results")
+        output.append(f"**Domain:** {result['domain']} | **Query:** {result['query']}")
+    output.append(f"**Source:** {result['file']} | **Found:** {result['count']} results\n")
+
+    for i, row in enumerate(result['results'], 1):
+        output.append(f"### Result {i}")
+        for key, value in row.items():
+            value_str = str(value)
+            if len(value_str) > 300:
+                value_str = value_str[:300] + "..."
+            output.append(f"- **{key}:** {value_str}")
+        output.append("")
+
+    return "\n".join(output)
+
+
+def build_request(args):
+    """Translate CLI arguments into a search_daemon request."""
+    if args.design_system:
+        return {
+            "op": "design_system",
+            "query": args.query,
+            "project_name": args.project_name,
+            "format": args.format,
+            "persist": args.persist,
+            "page": args.page,
+            # The daemon has its own cwd, so always send an absolute directory
+            "output_dir": os.path.abspath(args.output_dir or os.getcwd())
+        }
+    if args.stack:
+        return {"op": "search_stack", "query": args.query, "stack": args.stack, "max_results": args.max_results}
+    return {"op": "search", "query": args.query, "domain": args.domain, "max_results": args.max_results}
+
+
+# Ops a raw {"op": ...} batch line may send, with the fields each one requires
+BATCH_OPS = {"ping": (), "stats": (), "search": ("query",), "search_stack": ("query", "stack"),
+             "design_system": ("query",)}
+
+
+def _field_error(entry):
+    """Why a JSON batch entry's fields cannot be searched, or None."""
+    for key in ("query", "domain", "stack", "project_name", "format", "page", "output_dir"):
+        if entry.get(key) is not None and not isinstance(entry[key], str):
+            return f"{key} must be a string"
+    max_results = entry.get("max_results")
+    if max_results is not None and (isinstance(max_results, bool) or not isinstance(max_results, int)):
+        return "max_results must be an integer"
+    return None
+
+
+def _op_error(entry):
+    """Why a raw {"op": ...} batch entry cannot be run, or None."""
+    op = entry["op"]
+    if not isinstance(op, str) or op not in BATCH_OPS:
+        return f"Unknown op: {op!r} (expected one of: {', '.join(BATCH_OPS)})"
+    for key in BATCH_OPS[op]:
+        if not entry.get(key):
+            return f"Missing {key}"
+    return _field_error(entry)
+
+
+def batch_requests(lines, args):
+    """Yield (line number, request or error) for each non-empty batch line."""
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if not line.startswith("{"):
+            yield line_no, build_request(argparse.Namespace(**{**vars(args), "query": line}))
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, {"error": f"Invalid JSON: {e}"}
+            continue
+        if "op" in entry:
+            yield line_no, {"error": _op_error(entry)} if _op_error(entry) else entry
+        elif not entry.get("query"):
+            yield line_no, {"error": "Missing query"}
+        elif _field_error(entry):
+            yield line_no, {"error": _field_error(entry)}
+        else:
+            overrides = {key: entry[key] for key in ("query", "domain", "stack", "max_results") if key in entry}
+            if "domain" in entry and "stack" not in entry:
+                overrides["stack"] = None  # an explicit domain wins over a CLI --stack
+            yield line_no, build_request(argparse.Namespace(**{**vars(args), **overrides}))
+
+
+def run_batch(lines, args, out=sys.stdout):
+    """Answer every batch line with one JSON result line, flushing as we go."""
+    for line_no, payload in batch_requests(lines, args):
+        if "error" in payload:
+            result = payload
+        else:
+            try:
+                result = request(payload, args.socket) if args.use_daemon else None
+            except DaemonError as e:
+                result = {"error": f"daemon: {e}"}
+            if result is None:
+                try:
+                    result = handle(payload)
+                except Exception as e:
+                    # A bad request is that line's error, never the end of the stream
+                    result = {"error": f"{type(e).__name__}: {e}"}
+        if isinstance(result, dict):
+            result = {"line": line_no, **result}
+        else:
+            result = {"line": line_no, "output": result}
+        out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        out.flush()
+
+
+def print_stats(args):
+    """Print cache counters to stderr (stdout stays clean for --json / --batch)."""
+    try:
+        stats = request({"op": "stats"}, args.socket) if args.use_daemon else None
+    except DaemonError as e:
+        print(f"Error: search daemon: {e}", file=sys.stderr)
+        return
+    source = "daemon" if stats is not None else "process"
+    stats = stats or cache_stats()
+    results = stats["results"]
+    print(f"Cache ({source}): hits={results['hits']} misses={results['misses']} "
+          f"evictions={results['evictions']} invalidations={results['invalidations']} "
+          f"hit_rate={results['hit_rate']:.1%} size={results['size']}/{results['maxsize']} "
+          f"| indexes={stats['indexes']} tables={stats['tables']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max Search")
+    parser.add_argument("query", nargs="?", help="Search query")
+    parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
+    parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
+    parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    # Design system generation
+    parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
+    parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
+    parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
+    # Persistence (Master + Overrides pattern)
+    parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
+    parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
+    parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    # Index maintenance
+    parser.add_argument("--build-index", action="store_true", help="Prebuild the search index of every domain and stack")
+    parser.add_argument("--rebuild", action="store_true", help="With --build-index: refit even if the indexes are up to date")
+    # Bulk design systems
+    parser.add_argument("--bulk", type=str, default=None, help="Generate and persist design systems for every project in a JSON manifest")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="With --bulk: worker processes (default: min(8, CPUs))")
+    # Batch mode
+    parser.add_argument("--batch", type=str, default=None, help="Run every query in FILE (or '-' for stdin) and stream JSONL results")
+    # Search daemon
+    parser.add_argument("--serve", action="store_true", help="Run the search daemon (keeps all indexes warm)")
+    parser.add_argument("--use-daemon", action="store_true", help="Use the running search daemon, falling back to a local search")
+    parser.add_argument("--socket", type=str, default=None, help="Daemon socket path (default: per-user socket in the temp dir)")
+    parser.add_argument("--stats", action="store_true", help="Print result-cache hit/miss/eviction counters to stderr")
+
+    args = parser.parse_args()
+    if args.query is None and not (args.build_index or args.serve or args.batch or args.bulk or args.stats):
+        parser.error("the following arguments are required: query")
+    if args.stats:
+        import atexit
+        atexit.register(print_stats, args)
+
+    # Daemon
+    if args.serve:
+        serve(args.socket)
+        sys.exit(0)
+    # Index build
+    if args.build_index:
+        built = build_indexes(force=args.rebuild)
+        for entry in built:
+            print(f"Indexed {entry['name']}: {entry['documents']} documents ({entry['file']})")
+        sys.exit(0)
+    # Bulk design systems
+    if args.bulk:
+        from design_system import generate_design_systems_bulk, load_manifest
+        try:
+            projects = load_manifest(args.bulk)
+        except (OSError, ValueError) as e:
+            print(f"Error: --bulk {args.bulk}: {e}", file=sys.stderr)
+            sys.exit(1)
+        results = generate_design_systems_bulk(projects, args.output_dir, args.jobs)
+        if args.json:
+            print(json.dumps(results, indent=2, ensure_ascii=False))
+        else:
+            for entry in results:
+                if entry["status"] == "success":
+                    print(f"✅ {entry['project_name']}: {len(entry['created_files'])} files in {entry['design_system_dir']}")
+                else:
+                    print(f"❌ {entry['project_name']}: {entry['error']}")
+        sys.exit(0 if all(entry["status"] == "success" for entry in results) else 1)
+    # Batch
+    if args.batch:
+        if args.batch == "-":
+            run_batch(sys.stdin, args)
+        else:
+            with open(args.batch, 'r', encoding='utf-8') as f:
+                run_batch(f, args)
+        sys.exit(0)
+    # Stats only
+    if args.query is None:
+        sys.exit(0)
+
+    payload = build_request(args)
+    try:
+        result = request(payload, args.socket) if args.use_daemon else None
+    except DaemonError as e:
+        print(f"Error: search daemon: {e}", file=sys.stderr)
+        sys.exit(1)
+    if result is None:
+        result = handle(payload)
+
+    # Design system takes priority
+    if args.design_system:
+        print(result)
+        
+        # Print persistence confirmation
+        if args.persist:
+            project_slug = args.project_name.lower().replace(' ', '-') if args.project_name else "default"
+            print("\n" + "=" * 60)
+            print(f"✅ Design system persisted to design-system/{project_slug}/")
+            print(f"   📄 design-system/{project_slug}/MASTER.md (Global Source of Truth)")
+            if args.page:
+                page_filename = args.page.lower().replace(' ', '-')
+                print(f"   📄 design-system/{project_slug}/pages/{page_filename}.md (Page Overrides)")
+            print("")
+            print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
+            print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
+            print("=" * 60)
+    # Stack / domain search
+    elif args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print(format_output(result))
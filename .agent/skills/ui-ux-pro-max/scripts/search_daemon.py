@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Daemon - keeps every index warm and answers requests
+over a Unix domain socket, one JSON object per line.
+
+Usage:
+    python search.py --serve [--socket /path/to.sock]
+    python search.py "<query>" --use-daemon ...   (falls back to local search
+                                                   when no daemon answers)
+
+Protocol (request -> response, newline-delimited JSON):
+    {"op": "search", "query": "...", "domain": "style", "max_results": 3}
+    {"op": "search_stack", "query": "...", "stack": "react", "max_results": 3}
+    {"op": "design_system", "query": "...", "project_name": "...", "format": "ascii",
+     "persist": false, "page": null, "output_dir": "/abs/path"}
+    {"op": "stats"} | {"op": "ping"} | {"op": "shutdown"}
+    -> {"ok": true, "result": ...} or {"ok": false, "error": "..."}
+"""
+
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+from pathlib import Path
+
+from core import MAX_RESULTS, build_indexes, cache_stats, search, search_stack
+
+SOCKET_TIMEOUT = 30  # seconds a client waits for a response
+UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+
+def default_socket_path() -> str:
+    """Per-user socket in the temp dir (Unix socket paths are limited to ~100 chars)."""
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return str(Path(tempfile.gettempdir()) / f"uipro-search-{user}.sock")
+
+
+class DaemonError(Exception):
+    """The daemon answered {"ok": false, "error": ...}."""
+
+
+# ============ REQUEST HANDLING ============
+_generator = None
+
+
+def _shared_generator():
+    """One DesignSystemGenerator per process, so reasoning rules stay loaded."""
+    global _generator
+    if _generator is None:
+        from design_system import DesignSystemGenerator
+        _generator = DesignSystemGenerator()
+    return _generator
+
+
+def handle(request: dict):
+    """Run one request in this process and return its result."""
+    op = request.get("op", "search")
+    max_results = request.get("max_results") or MAX_RESULTS
+
+    if op == "ping":
+        return "pong"
+    if op == "stats":
+        return cache_stats()
+    if op == "search":
+        return search(request["query"], request.get("domain"), max_results)
+    if op == "search_stack":
+        return search_stack(request["query"], request["stack"], max_results)
+    if op == "design_system":
+        from design_system import generate_design_system
+        return generate_design_system(
+            request["query"],
+            request.get("project_name"),
+            request.get("format", "ascii"),
+            persist=request.get("persist", False),
+            page=request.get("page"),
+            output_dir=request.get("output_dir"),
+            generator=_shared_generator()
+        )
+    raise ValueError(f"Unknown op: {op}")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if request.get("op") == "shutdown":
+                    response = {"ok": True, "result": "bye"}
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                else:
+                    response = {"ok": True, "result": handle(request)}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+if UNIX_SOCKETS:
+    class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+# ============ SERVER ============
+def serve(socket_path: str = None) -> None:
+    """Warm every index and the reasoning rules, then serve until shut down."""
+    if not UNIX_SOCKETS:
+        raise SystemExit("Error: Unix domain sockets are not available on this platform")
+
+    socket_path = socket_path or default_socket_path()
+    if os.path.exists(socket_path):
+        try:
+            running = request({"op": "ping"}, socket_path) is not None
+        except DaemonError:
+            running = True
+        if running:
+            raise SystemExit(f"Error: a search daemon is already running on {socket_path}")
+        os.unlink(socket_path)  # stale socket from a daemon that died
+
+    built = build_indexes()
+    _shared_generator()
+
+    server = _Server(socket_path, _RequestHandler)
+    print(f"UI Pro Max search daemon: {len(built)} indexes warm, listening on {socket_path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+
+# ============ CLIENT ============
+def request(payload: dict, socket_path: str = None):
+    """
+    Send one request to a running daemon.
+
+    Returns the result, or None when no daemon answers (callers then run the
+    request locally with handle()). Raises DaemonError when the daemon
+    answers with an error, rather than silently retrying locally.
+    """
+    if not UNIX_SOCKETS:
+        return None
+    socket_path = socket_path or default_socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(SOCKET_TIMEOUT)
+            sock.connect(socket_path)
+            sock.sendall((json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise DaemonError(response.get("error", "unknown daemon error"))
+    return response["result"]
@@ -3,8 +3,14 @@
 Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
-Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
-Output: JSON with validation findings
+Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config] [--no-cache]
+                                               [--changed-since <ref>] [--output json|summary|jsonl]
+                                               [--max-file-size <MB>] [--minified scan|downgrade|skip]
+                                               [--mmap-above <MB>]
+Output: JSON with validation findings (or streamed JSONL records with --output jsonl)
+
+Per-file findings are cached in .agent/.cache/, so repeat runs only rescan
+files whose size/mtime (and then content hash) changed.
 
 This script verifies:
 1. Dependencies - Supply chain security (OWASP A03)
@@ -13,15 +19,30 @@ This script verifies:
 4. Configuration - Security settings validated (OWASP A02)
 """
 import subprocess
+import hashlib
 import json
+import mmap
 import os
 import sys
 import re
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, NamedTuple, Optional, Tuple
 from datetime import datetime
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+# Shared helpers live in .agent/scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "scripts"))
+from changed_files import GitDiffError, changed_files
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -88,6 +109,670 @@ DANGEROUS_PATTERNS = [
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
+CONFIG_FILENAMES = {'next.config.js', 'webpack.config.js', '.eslintrc.js'}
+PARALLEL_BATCH_FILES = 16  # --jobs: files handed to a worker per task
+PARALLEL_BATCHES_PER_JOB = 4  # --jobs: tasks in flight per worker process
+CACHE_DIR = Path(__file__).resolve().parents[3] / ".cache"  # .agent/.cache/
+CACHE_VERSION = 2  # bump when the shape of cached findings changes
+
+# Large files: skipped above --max-file-size, scanned through mmap above --mmap-above (both opt-in)
+MAX_SNIPPET_BYTES = 4096  # a mapped line is only decoded this far for its snippet
+
+# Minified / generated files (--minified scan|downgrade|skip; secrets are always scanned in full)
+MINIFIED_SAMPLE = 64 << 10  # leading bytes/chars inspected
+MINIFIED_LINE_LENGTH = 1000  # average line length that marks a file as minified
+GENERATED_FILENAMES = {'package-lock.json', 'npm-shrinkwrap.json', 'pnpm-lock.yaml', 'composer.lock'}
+
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
+
+# ============================================================================
+#  PATTERN MATCHING ENGINE
+# ============================================================================
+
+def fold_case(text: str) -> str:
+    """Case-fold text so that any re.IGNORECASE match of an ASCII literal is a substring."""
+    # casefold() covers every IGNORECASE equivalence except the Turkish i's:
+    # dotless i stays itself and U+0130 folds to 'i' plus a combining dot
+    return text.casefold().replace('\u0131', 'i').replace('i\u0307', 'i')
+
+
+def required_literals(pattern: str) -> Optional[List[str]]:
+    """
+    Case-folded literals of which every match of pattern must contain at least one.
+
+    Derived from the parsed regex: runs of plain characters in the top-level
+    sequence (and in the groups it contains), or one literal per alternative of
+    an alternation such as (?:SELECT|INSERT). The most selective candidate wins.
+    None means no usable literal exists, so the pattern is always run.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+
+    def best(candidates: list) -> Optional[list]:
+        return max(candidates, key=lambda options: min(map(len, options))) if candidates else None
+
+    def sequence_candidates(items) -> list:
+        candidates, run = [], []
+        for op, av in list(items) + [(None, None)]:
+            if op is sre_parse.LITERAL:
+                run.append(chr(av))
+                continue
+            if run:
+                candidates.append(["".join(run)])
+                run = []
+            if op is sre_parse.SUBPATTERN:
+                candidates.extend(sequence_candidates(av[-1]))
+            elif op is sre_parse.BRANCH:
+                per_branch = [best(sequence_candidates(branch)) for branch in av[1]]
+                if all(per_branch):
+                    candidates.append([option for options in per_branch for option in options])
+        return candidates
+
+    literals = best(sequence_candidates(parsed))
+    return [fold_case(lit) for lit in literals] if literals else None
+
+
+class PatternMatcher:
+    """
+    Literal-prefilter-then-verify matcher for a list of IGNORECASE patterns.
+
+    Each pattern is compiled once and guarded by its required literals. A file
+    is case-folded once; only patterns whose literals occur in it are run, and
+    for line scans only on the lines where a literal occurs. A pattern or line
+    is only skipped when fold_case() shows none of its literals can match.
+
+    With --mmap-above, large files are passed as a memory-mapped buffer with
+    folded=None instead: the bytes twin of each pattern runs over the map
+    directly, without a prefilter, and line boundaries are only looked up
+    around a match.
+    """
+
+    def __init__(self, patterns: List[tuple]):
+        self.patterns = [(re.compile(p[0], re.IGNORECASE), required_literals(p[0]), p[1:]) for p in patterns]
+        self.byte_patterns = [(compile_bytes(p[0]), p[1:]) for p in patterns]
+
+    def count_matches(self, content, folded: Optional[str]) -> List[Tuple[tuple, int]]:
+        """(pattern info, re.findall count) for every pattern matching content, in pattern order."""
+        if folded is None:
+            counts = ((info, sum(1 for _ in regex.finditer(content))) for regex, info in self.byte_patterns)
+            return [(info, count) for info, count in counts if count]
+
+        hits = []
+        for regex, literals, info in self.patterns:
+            if literals is not None and not any(lit in folded for lit in literals):
+                continue
+            count = len(regex.findall(content))
+            if count:
+                hits.append((info, count))
+        return hits
+
+    def match_lines(self, content, folded: Optional[str]) -> List[Tuple[int, str, tuple]]:
+        """(line number, line, pattern info) for every line a pattern matches, by line then pattern."""
+        if folded is None:
+            return self.match_mapped_lines(content)
+
+        lines = content.split('\n')
+        line_ends = None
+        candidates = []  # (line index, pattern index)
+
+        for pattern_idx, (regex, literals, info) in enumerate(self.patterns):
+            if literals is None:
+                candidates.extend((line_idx, pattern_idx) for line_idx in range(len(lines)))
+                continue
+            line_idxs = set()
+            for lit in literals:
+                pos = folded.find(lit)
+                if pos == -1:
+                    continue
+                if line_ends is None:
+                    # Case folding may change lengths, so map offsets via the folded text
+                    line_ends = list(accumulate(len(line) + 1 for line in folded.split('\n')))
+                while pos != -1:
+                    line_idx = bisect_right(line_ends, pos)
+                    line_idxs.add(line_idx)
+                    pos = folded.find(lit, line_ends[line_idx])
+            candidates.extend((line_idx, pattern_idx) for line_idx in line_idxs)
+
+        matches = []
+        last = len(lines) - 1
+        for line_idx, pattern_idx in sorted(candidates):
+            # readlines() semantics: every line but the last keeps its newline
+            line = lines[line_idx] + '\n' if line_idx < last else lines[line_idx]
+            regex, _, info = self.patterns[pattern_idx]
+            if regex.search(line):
+                matches.append((line_idx + 1, line, info))
+        return matches
+
+    def match_mapped_lines(self, buf) -> List[Tuple[int, str, tuple]]:
+        """
+        match_lines() over a bytes-like buffer without splitting it into lines.
+
+        Each pattern searches the whole buffer; a hit is checked against its own
+        line (search bounded to the line, so per-line semantics hold) and the
+        search resumes at the next line. Any line with a match is reached, since
+        the leftmost match found from a line start never begins after it.
+        """
+        lines = MappedLines(buf)
+        hits = []  # (line index, pattern index, line text)
+        for pattern_idx, (regex, _) in enumerate(self.byte_patterns):
+            pos = 0
+            while True:
+                match = regex.search(buf, pos)
+                if match is None:
+                    break
+                line_idx = lines.index(match.start())
+                start, end = lines.bounds(line_idx)
+                if regex.search(buf, start, end):
+                    hits.append((line_idx, pattern_idx, lines.text(line_idx)))
+                if end >= len(buf):
+                    break
+                pos = end
+        return [(line_idx + 1, line, self.byte_patterns[pattern_idx][1])
+                for line_idx, pattern_idx, line in sorted(hits)]
+
+
+class MappedLines:
+    """Line lookups in a bytes-like buffer via a newline offset index, built on first use."""
+
+    def __init__(self, buf):
+        self.buf = buf
+        self.newlines = None
+
+    def index(self, offset: int) -> int:
+        if self.newlines is None:
+            self.newlines = [m.start() for m in re.finditer(b'\n', self.buf)]
+        return bisect_left(self.newlines, offset)
+
+    def bounds(self, line_idx: int) -> Tuple[int, int]:
+        """[start, end) of a line, its newline included (readlines() semantics)."""
+        start = self.newlines[line_idx - 1] + 1 if line_idx else 0
+        end = self.newlines[line_idx] + 1 if line_idx < len(self.newlines) else len(self.buf)
+        return start, end
+
+    def text(self, line_idx: int) -> str:
+        start, end = self.bounds(line_idx)
+        return self.buf[start:min(end, start + MAX_SNIPPET_BYTES)].decode('utf-8', errors='ignore')
+
+
+def compile_bytes(pattern: str):
+    """
+    IGNORECASE bytes twin of a str pattern, for scanning memory-mapped files.
+    Not equivalent on non-ASCII text: case folding and \\s are ASCII-only,
+    character classes count bytes and invalid UTF-8 is not dropped.
+    """
+    return re.compile(pattern.encode('utf-8'), re.IGNORECASE)
+
+
+def looks_minified(name: str, sample) -> bool:
+    """Lockfiles, *.min.* bundles, or a leading sample whose average line is very long."""
+    if name in GENERATED_FILENAMES or '.min.' in name:
+        return True
+    newline = b'\n' if isinstance(sample, (bytes, bytearray)) else '\n'
+    return len(sample) / (sample.count(newline) + 1) > MINIFIED_LINE_LENGTH
+
+
+SECRET_MATCHER = PatternMatcher(SECRET_PATTERNS)
+DANGEROUS_MATCHER = PatternMatcher(DANGEROUS_PATTERNS)
+CONFIG_REGEXES = [(re.compile(pattern, re.IGNORECASE), issue, severity) for pattern, issue, severity in CONFIG_ISSUES]
+CONFIG_BYTE_REGEXES = [(compile_bytes(pattern), issue, severity) for pattern, issue, severity in CONFIG_ISSUES]
+
+
+# ============================================================================
+#  FILE TRAVERSAL
+# ============================================================================
+
+def secret_findings(rel_path: str, content: str, folded: str) -> List[Dict[str, Any]]:
+    """Secret findings for one file: one entry per secret type with its match count."""
+    return [
+        {"file": rel_path, "type": secret_type, "severity": severity, "count": count}
+        for (secret_type, severity), count in SECRET_MATCHER.count_matches(content, folded)
+    ]
+
+
+def pattern_findings(rel_path: str, content: str, folded: str) -> List[Dict[str, Any]]:
+    """Dangerous pattern findings for one file: one entry per matching line and pattern."""
+    return [
+        {
+            "file": rel_path,
+            "line": line_num,
+            "pattern": name,
+            "severity": severity,
+            "category": category,
+            "snippet": line.strip()[:80]
+        }
+        for line_num, line, (name, severity, category) in DANGEROUS_MATCHER.match_lines(content, folded)
+    ]
+
+
+def config_findings(rel_path: str, content: str, folded: str) -> List[Dict[str, Any]]:
+    """Configuration findings for one file: one entry per matching config issue."""
+    return [
+        {"file": rel_path, "issue": issue, "severity": severity}
+        for regex, issue, severity in (CONFIG_BYTE_REGEXES if folded is None else CONFIG_REGEXES)
+        if regex.search(content)
+    ]
+
+
+# scan key -> (extensions, exact file names, per-file scanner)
+FILE_SCANNERS = {
+    "secrets": (CODE_EXTENSIONS | CONFIG_EXTENSIONS, set(), secret_findings),
+    "patterns": (CODE_EXTENSIONS, set(), pattern_findings),
+    "config": (CONFIG_EXTENSIONS, CONFIG_FILENAMES, config_findings),
+}
+
+
+def candidate_files(project_path: str, keys: List[str],
+                    changed: Optional[List[Path]] = None) -> Iterator[Tuple[Path, Tuple[str, ...]]]:
+    """
+    Yield (file path, scan keys that accept it) for every file a requested scanner wants, in walk order.
+    With changed (a --changed-since file list) only those files are considered.
+    """
+    scanners = [(key,) + FILE_SCANNERS[key][:2] for key in keys]
+
+    if changed is not None:
+        for filepath in changed:
+            wanted = tuple(key for key, exts, names in scanners
+                           if filepath.suffix.lower() in exts or filepath.name in names)
+            if wanted:
+                yield filepath, wanted
+        return
+
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS
+                   and not (d == CACHE_DIR.name and (Path(root) / d).resolve() == CACHE_DIR)]
+
+        for file in files:
+            ext = Path(file).suffix.lower()
+            wanted = tuple(key for key, exts, names in scanners if ext in exts or file in names)
+            if wanted:
+                yield Path(root) / file, wanted
+
+
+class ScanLimits(NamedTuple):
+    """How large and minified files are handled (--max-file-size, --minified)."""
+    max_bytes: Optional[int] = None  # larger files are skipped (None: no limit)
+    mmap_bytes: Optional[int] = None  # larger files are scanned through mmap as bytes (None: never)
+    minified: str = "scan"  # scan | downgrade (findings become "low") | skip (no findings)
+
+
+DEFAULT_LIMITS = ScanLimits()
+
+
+def scan_file(filepath: Path, rel_path: str, keys: Tuple[str, ...],
+              limits: ScanLimits = DEFAULT_LIMITS) -> Optional[Dict[str, list]]:
+    """
+    Read and case-fold one file once and run every requested scanner on it.
+    Files above limits.mmap_bytes (if set) are memory-mapped and scanned as bytes instead.
+    Returns {key: findings}, or None when the file cannot be read.
+    """
+    try:
+        if limits.mmap_bytes is not None and filepath.stat().st_size > limits.mmap_bytes:
+            with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return run_scanners(filepath, rel_path, keys, limits, buf, None, buf[:MINIFIED_SAMPLE])
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+    except Exception:
+        return None
+
+    return run_scanners(filepath, rel_path, keys, limits, content, fold_case(content), content[:MINIFIED_SAMPLE])
+
+
+def run_scanners(filepath: Path, rel_path: str, keys: Tuple[str, ...], limits: ScanLimits,
+                 content, folded: Optional[str], sample) -> Dict[str, list]:
+    """
+    Run the requested scanners on loaded (or mapped, folded=None) content,
+    applying the minified policy to every scanner but secrets: a credential
+    is just as live in a bundle, so it is never skipped or downgraded.
+    """
+    minified = limits.minified != "scan" and looks_minified(filepath.name, sample)
+
+    findings = {}
+    for key in keys:
+        if minified and key != "secrets" and limits.minified == "skip":
+            findings[key] = []
+            continue
+        try:
+            findings[key] = FILE_SCANNERS[key][2](rel_path, content, folded)
+        except Exception:
+            findings[key] = []
+        if minified and key != "secrets":
+            for finding in findings[key]:
+                finding.update(severity="low", minified=True)
+    return findings
+
+
+# ============================================================================
+#  FINDINGS CACHE
+# ============================================================================
+
+def rules_signature(limits: ScanLimits = DEFAULT_LIMITS) -> str:
+    """Hash of every rule table and the scan limits; any edit to them invalidates all cached findings."""
+    rules = (CACHE_VERSION, SECRET_PATTERNS, DANGEROUS_PATTERNS, CONFIG_ISSUES,
+             tuple(limits), MINIFIED_LINE_LENGTH, sorted(GENERATED_FILENAMES))
+    return hashlib.sha1(repr(rules).encode('utf-8')).hexdigest()
+
+
+def cache_path(project_path: str) -> Path:
+    """One cache file per scanned project, keyed by its absolute path."""
+    name = hashlib.sha1(str(Path(project_path).resolve()).encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f"security_scan-{name}.jsonl"
+
+
+def file_stamp(filepath: Path) -> Optional[List[int]]:
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def file_digest(filepath: Path) -> Optional[str]:
+    try:
+        with open(filepath, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class FindingsCache:
+    """
+    Persistent per-file findings, keyed by relative path.
+
+    An entry is reused while the file's (mtime, size) stamp matches. When the
+    stamp differs the content hash decides: an unchanged file (e.g. after a
+    fresh checkout) only gets its stamp refreshed. Entries hold findings per
+    scan key, so a run with a new --scan-type only scans the missing keys.
+
+    The cache is JSONL: a signature line, then one `<path>\t<entry>` line per
+    file. Loading only records where each entry starts; an entry is read when
+    its file is looked up, and written to the next cache as soon as the
+    file's findings are final, so no side holds the whole tree's findings.
+    """
+
+    def __init__(self, path: Path, limits: ScanLimits = DEFAULT_LIMITS):
+        self.path = path
+        self.signature = rules_signature(limits)
+        self.offsets: Dict[str, int] = {}  # rel path -> offset of its line in the loaded cache
+        self.pending: Dict[str, Dict[str, Any]] = {}  # entries waiting for their missing scan keys
+        self.done = set()  # rel paths written to the next cache, or dropped as stale
+        self.touched = set()
+        self.hits = 0
+        self.misses = 0
+        self._old = None  # loaded cache file
+        self._new = None  # next cache, opened on the first write
+        self._failed = False  # the next cache could not be written; keep the loaded one
+        self._tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+    def load(self) -> "FindingsCache":
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            return self
+        try:
+            header = json.loads(f.readline())
+            if not isinstance(header, dict) or header.get("signature") != self.signature:
+                f.close()
+                return self
+            offset = f.tell()
+            for line in f:
+                rel_path, tab, _ = line.partition(b'\t')
+                if tab:
+                    self.offsets[json.loads(rel_path)] = offset
+                offset += len(line)
+        except (OSError, ValueError):
+            f.close()
+            self.offsets = {}
+            return self
+        self._old = f
+        return self
+
+    def _line(self, rel_path: str) -> Optional[bytes]:
+        offset = self.offsets.get(rel_path)
+        if offset is None or self._old is None:
+            return None
+        try:
+            self._old.seek(offset)
+            return self._old.readline()
+        except OSError:
+            return None
+
+    def _entry(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        line = self._line(rel_path)
+        if not line:
+            return None
+        try:
+            return json.loads(line.partition(b'\t')[2])
+        except ValueError:
+            return None
+
+    def _open_next(self) -> bool:
+        if self._new is None and not self._failed:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._new = open(self._tmp_path, 'wb')
+                self._new.write(json.dumps({"signature": self.signature}).encode('utf-8') + b'\n')
+            except OSError:
+                self._fail()
+        return self._new is not None
+
+    def _fail(self):
+        """A read-only tree just means no persistence."""
+        self._failed = True
+        if self._new is not None:
+            try:
+                self._new.close()
+            except OSError:
+                pass
+            self._new = None
+        try:
+            self._tmp_path.unlink()
+        except OSError:
+            pass
+
+    def _write(self, rel_path: str, line: bytes):
+        """Append one entry line to the next cache."""
+        self.done.add(rel_path)
+        if self._open_next():
+            try:
+                self._new.write(line)
+            except OSError:
+                self._fail()
+
+    def _write_entry(self, rel_path: str, entry: Dict[str, Any]):
+        self._write(rel_path, f"{json.dumps(rel_path)}\t{json.dumps(entry)}\n".encode('utf-8'))
+
+    def lookup(self, filepath: Path, rel_path: str, keys: Tuple[str, ...]) -> Tuple[Dict[str, list], Tuple[str, ...]]:
+        """(cached findings for keys, keys that still need scanning) for one file."""
+        self.touched.add(rel_path)
+        entry = self._entry(rel_path)
+        stamp = file_stamp(filepath)
+        if entry is not None and entry["stamp"] != stamp:
+            if stamp is not None and entry["digest"] == file_digest(filepath):
+                entry["stamp"] = stamp
+            else:
+                entry = None
+        if entry is None:
+            self.done.add(rel_path)
+            self.misses += 1
+            return {}, keys
+
+        cached = {key: entry["findings"][key] for key in keys if key in entry["findings"]}
+        missing = tuple(key for key in keys if key not in cached)
+        if missing:
+            self.misses += 1
+            self.pending[rel_path] = entry
+        else:
+            self.hits += 1
+            self._write_entry(rel_path, entry)
+        return cached, missing
+
+    def store(self, filepath: Path, rel_path: str, findings: Dict[str, list]):
+        entry = self.pending.pop(rel_path, None)
+        if entry is None:
+            stamp, digest = file_stamp(filepath), file_digest(filepath)
+            if stamp is None or digest is None:
+                return
+            entry = {"stamp": stamp, "digest": digest, "findings": {}}
+        entry["findings"].update(findings)
+        self._write_entry(rel_path, entry)
+
+    def save(self, project_path: str):
+        """
+        Finish the next cache and atomically replace the loaded one. Entries of
+        files this run did not look up are carried over unless the file is gone.
+        """
+        for rel_path, entry in list(self.pending.items()):
+            self._write_entry(rel_path, entry)
+        self.pending.clear()
+        for rel_path in self.offsets:
+            if rel_path not in self.done and (Path(project_path) / rel_path).exists():
+                line = self._line(rel_path)
+                if line:
+                    self._write(rel_path, line)
+        opened = self._open_next()
+        if self._old is not None:
+            self._old.close()
+            self._old = None
+        if not opened:
+            return
+        try:
+            self._new.close()
+            self._new = None
+            os.replace(self._tmp_path, self.path)
+        except OSError:
+            self._fail()
+
+    def discard(self):
+        """Drop the next cache and keep the loaded one (an interrupted run)."""
+        if self._old is not None:
+            self._old.close()
+            self._old = None
+        self._fail()
+
+
+def _resolve(cache: Optional[FindingsCache], findings: Optional[Dict[str, list]], task: Optional[tuple],
+             fresh: Optional[Dict[str, list]]) -> Optional[Dict[str, list]]:
+    """Merge one file's fresh findings into its cached ones and record them in the cache."""
+    if task and fresh is not None:
+        findings.update(fresh)
+        if cache:
+            cache.store(task[0], task[1], fresh)
+    return findings
+
+
+def _scan_batch_task(tasks: List[tuple]) -> List[Optional[Dict[str, list]]]:
+    return [scan_file(*task) for task in tasks]
+
+
+def iter_file_findings(project_path: str, keys: List[str], jobs: int = 1, cache: Optional[FindingsCache] = None,
+                       changed: Optional[List[Path]] = None, limits: ScanLimits = DEFAULT_LIMITS
+                       ) -> Iterator[Tuple[Tuple[str, ...], Optional[Dict[str, list]]]]:
+    """
+    Walk the project once for every requested file scanner, yielding
+    (scan keys, {key: findings}) per candidate file in walk order, or
+    (scan keys, None) for a file skipped for exceeding limits.max_bytes.
+
+    Each candidate file is read and case-folded once and handed to every
+    scanner that accepts it. With a cache, files whose findings are still
+    valid are not read at all, and with changed only the files it lists are
+    considered. Nothing is collected up front: each file is yielded as soon
+    as its findings are resolved. Serially a file is scanned when it is
+    reached; with jobs > 1 files go to a process pool in batches of
+    PARALLEL_BATCH_FILES, at most PARALLEL_BATCHES_PER_JOB per worker in flight.
+    """
+    if jobs <= 1:
+        completed = False
+        try:
+            for wanted, findings, task in _lookups(project_path, keys, cache, changed, limits):
+                yield wanted, _resolve(cache, findings, task, scan_file(*task) if task else None)
+            completed = True
+        finally:
+            _close_cache(cache, project_path, completed)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=jobs)
+    in_flight = deque()  # [scan keys, findings, task, future, index in batch], in walk order
+    batch = []  # entries whose tasks are not submitted yet
+    max_in_flight = jobs * PARALLEL_BATCHES_PER_JOB * PARALLEL_BATCH_FILES
+
+    def submit():
+        future = pool.submit(_scan_batch_task, [entry[2] for entry in batch])
+        for index, entry in enumerate(batch):
+            entry[3:] = [future, index]
+        batch.clear()
+
+    def finish(entry):
+        if entry[2] and entry[3] is None:
+            submit()
+        wanted, findings, task, future, index = entry
+        return wanted, _resolve(cache, findings, task, future.result()[index] if task else None)
+
+    completed = False
+    try:
+        for wanted, findings, task in _lookups(project_path, keys, cache, changed, limits):
+            entry = [wanted, findings, task, None, None]
+            in_flight.append(entry)
+            if task:
+                batch.append(entry)
+                if len(batch) >= PARALLEL_BATCH_FILES:
+                    submit()
+            while in_flight and (not in_flight[0][2] or len(in_flight) > max_in_flight
+                                 or (in_flight[0][3] is not None and in_flight[0][3].done())):
+                yield finish(in_flight.popleft())
+        while in_flight:
+            yield finish(in_flight.popleft())
+        completed = True
+    finally:
+        pool.shutdown(cancel_futures=True)
+        _close_cache(cache, project_path, completed)
+
+
+def _lookups(project_path: str, keys: List[str], cache: Optional[FindingsCache], changed: Optional[List[Path]],
+             limits: ScanLimits) -> Iterator[Tuple[Tuple[str, ...], Optional[Dict[str, list]], Optional[tuple]]]:
+    """(scan keys, cached findings or None if skipped, scan task or None) per candidate file, as walked."""
+    for filepath, wanted in candidate_files(project_path, keys, changed) if keys else ():
+        stamp = file_stamp(filepath)
+        if stamp is not None and limits.max_bytes is not None and stamp[1] > limits.max_bytes:
+            yield wanted, None, None
+            continue
+        rel_path = str(filepath.relative_to(project_path))
+        cached, missing = cache.lookup(filepath, rel_path, wanted) if cache else ({}, wanted)
+        yield wanted, cached, (filepath, rel_path, missing, limits) if missing else None
+
+
+def _close_cache(cache: Optional[FindingsCache], project_path: str, completed: bool):
+    if cache:
+        if completed:
+            cache.save(project_path)
+        else:
+            cache.discard()
+
+
+def walk_project(project_path: str, keys: List[str], jobs: int = 1, cache: Optional[FindingsCache] = None,
+                 changed: Optional[List[Path]] = None, limits: ScanLimits = DEFAULT_LIMITS) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect iter_file_findings() per scanner.
+    Returns {key: {"findings": [...], "scanned_files": n, "skipped_files": n}}.
+    """
+    walked = {key: {"findings": [], "scanned_files": 0, "skipped_files": 0} for key in keys}
+    for wanted, findings in iter_file_findings(project_path, keys, jobs, cache, changed, limits):
+        for key in wanted:
+            if findings is None:
+                walked[key]["skipped_files"] += 1
+                continue
+            walked[key]["scanned_files"] += 1
+            walked[key]["findings"].extend(findings.get(key, []))
+    return walked
 
 
 # ============================================================================
@@ -178,54 +863,28 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+def scan_secrets(project_path: str, walked: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
     """
+    if walked is None:
+        walked = walk_project(project_path, ["secrets"])["secrets"]
+
     results = {
         "tool": "secret_scanner",
-        "findings": [],
+        "findings": walked["findings"],
         "status": "[OK] No secrets detected",
-        "scanned_files": 0,
+        "scanned_files": walked["scanned_files"],
+        "skipped_files": walked.get("skipped_files", 0),
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
-                pass
+    for finding in results["findings"]:
+        severity = finding["severity"]
+        results["by_severity"][severity] = results["by_severity"].get(severity, 0) + finding["count"]
     
-    if results["by_severity"]["critical"] > 0:
-        results["status"] = "[!!] CRITICAL: Secrets exposed!"
-    elif results["by_severity"]["high"] > 0:
-        results["status"] = "[!] HIGH: Secrets found"
-    elif sum(results["by_severity"].values()) > 0:
-        results["status"] = "[?] Potential secrets detected"
+    results["status"] = secrets_status(results["by_severity"])
     
     # Limit findings for output
     results["findings"] = results["findings"][:15]
@@ -233,59 +892,30 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def scan_code_patterns(project_path: str, walked: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
     """
+    if walked is None:
+        walked = walk_project(project_path, ["patterns"])["patterns"]
+
     results = {
         "tool": "pattern_scanner",
-        "findings": [],
+        "findings": walked["findings"],
         "status": "[OK] No dangerous patterns",
-        "scanned_files": 0,
+        "scanned_files": walked["scanned_files"],
+        "skipped_files": walked.get("skipped_files", 0),
         "by_category": {}
     }
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
-    
-    critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
-    high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
+    by_severity = {}
+    for finding in results["findings"]:
+        category = finding["category"]
+        results["by_category"][category] = results["by_category"].get(category, 0) + 1
+        by_severity[finding["severity"]] = by_severity.get(finding["severity"], 0) + 1
     
-    if critical_count > 0:
-        results["status"] = f"[!!] CRITICAL: {critical_count} dangerous patterns"
-    elif high_count > 0:
-        results["status"] = f"[!] HIGH: {high_count} risky patterns"
-    elif results["findings"]:
-        results["status"] = "[?] Some patterns need review"
+    results["status"] = patterns_status(by_severity)
     
     # Limit findings
     results["findings"] = results["findings"][:20]
@@ -293,89 +923,119 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def scan_configuration(project_path: str, walked: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
     """
+    if walked is None:
+        walked = walk_project(project_path, ["config"])["config"]
+
     results = {
         "tool": "config_scanner",
-        "findings": [],
+        "findings": walked["findings"],
         "status": "[OK] Configuration secure",
         "checks": {}
     }
     
-    # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
+    checks, header_findings = check_security_headers(project_path)
+    results["checks"].update(checks)
+    results["findings"].extend(header_findings)
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
+    results["status"] = config_status({f["severity"] for f in results["findings"]})
     
-    # Check for security header configurations
+    return results
+
+
+def check_security_headers(project_path: str) -> Tuple[Dict[str, bool], List[Dict[str, Any]]]:
+    """(checks, findings) for the project-level security header configuration."""
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
     for hf in header_files:
         hf_path = Path(project_path) / hf
         if hf_path.exists():
-            results["checks"]["security_headers_config"] = True
-            break
-    else:
-        results["checks"]["security_headers_config"] = False
-        results["findings"].append({
-            "issue": "No security headers configuration found",
-            "severity": "medium",
-            "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
-        })
-    
-    if any(f["severity"] == "critical" for f in results["findings"]):
-        results["status"] = "[!!] CRITICAL: Configuration issues"
-    elif any(f["severity"] == "high" for f in results["findings"]):
-        results["status"] = "[!] HIGH: Configuration review needed"
-    elif results["findings"]:
-        results["status"] = "[?] Minor configuration issues"
-    
-    return results
+            return {"security_headers_config": True}, []
+    return {"security_headers_config": False}, [{
+        "issue": "No security headers configuration found",
+        "severity": "medium",
+        "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
+    }]
+
+
+# ============================================================================
+#  STATUS
+# ============================================================================
+
+def secrets_status(by_severity: Dict[str, int]) -> str:
+    if by_severity.get("critical", 0) > 0:
+        return "[!!] CRITICAL: Secrets exposed!"
+    if by_severity.get("high", 0) > 0:
+        return "[!] HIGH: Secrets found"
+    if sum(by_severity.values()) > 0:
+        return "[?] Potential secrets detected"
+    return "[OK] No secrets detected"
+
+
+def patterns_status(by_severity: Dict[str, int]) -> str:
+    critical_count = by_severity.get("critical", 0)
+    high_count = by_severity.get("high", 0)
+    if critical_count > 0:
+        return f"[!!] CRITICAL: {critical_count} dangerous patterns"
+    if high_count > 0:
+        return f"[!] HIGH: {high_count} risky patterns"
+    if sum(by_severity.values()) > 0:
+        return "[?] Some patterns need review"
+    return "[OK] No dangerous patterns"
+
+
+def config_status(severities: set) -> str:
+    if "critical" in severities:
+        return "[!!] CRITICAL: Configuration issues"
+    if "high" in severities:
+        return "[!] HIGH: Configuration review needed"
+    if severities:
+        return "[?] Minor configuration issues"
+    return "[OK] Configuration secure"
+
+
+def overall_status(summary: Dict[str, Any]) -> str:
+    if summary["critical"] > 0:
+        return "[!!] CRITICAL ISSUES FOUND"
+    if summary["high"] > 0:
+        return "[!] HIGH RISK ISSUES"
+    if summary["total_findings"] > 0:
+        return "[?] REVIEW RECOMMENDED"
+    return "[OK] SECURE"
 
 
 # ============================================================================
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+SCANNERS = {
+    "deps": ("dependencies", scan_dependencies),
+    "secrets": ("secrets", scan_secrets),
+    "patterns": ("code_patterns", scan_code_patterns),
+    "config": ("configuration", scan_configuration),
+}
+
+
+def scoped_files(project_path: str, changed_since: Optional[str]) -> Optional[List[Path]]:
+    """Files changed since the git ref (minus the findings cache), or None to walk the whole tree."""
+    if changed_since is None:
+        return None
+    changed = changed_files(project_path, changed_since, skip_dirs=SKIP_DIRS)
+    return [f for f in changed if f.resolve().parent != CACHE_DIR]
+
+
+def run_full_scan(project_path: str, scan_type: str = "all", jobs: int = 1, use_cache: bool = True,
+                  changed_since: Optional[str] = None, limits: ScanLimits = DEFAULT_LIMITS) -> Dict[str, Any]:
+    """Execute security validation scans. With changed_since, file scanners only see files changed since that git ref."""
     
     report = {
         "project": project_path,
         "timestamp": datetime.now().isoformat(),
         "scan_type": scan_type,
+        "changed_since": changed_since,
         "scans": {},
         "summary": {
             "total_findings": 0,
@@ -385,56 +1045,162 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
         }
     }
     
-    scanners = {
-        "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
-    }
+    # One shared walk feeds every enabled file scanner
+    enabled = [key for key in SCANNERS if scan_type == "all" or scan_type == key]
+    changed = scoped_files(project_path, changed_since)
+    cache = FindingsCache(cache_path(project_path), limits).load() if use_cache else None
+    walked = walk_project(project_path, [key for key in enabled if key in FILE_SCANNERS], jobs, cache, changed, limits)
     
-    for key, (name, scanner) in scanners.items():
-        if scan_type == "all" or scan_type == key:
+    for key in enabled:
+        name, scanner = SCANNERS[key]
+        if key in walked:
+            result = scanner(project_path, walked[key])
+        else:
             result = scanner(project_path)
-            report["scans"][name] = result
-            
-            findings_count = len(result.get("findings", []))
-            report["summary"]["total_findings"] += findings_count
-            
-            for finding in result.get("findings", []):
-                sev = finding.get("severity", "low")
-                if sev == "critical":
-                    report["summary"]["critical"] += 1
-                elif sev == "high":
-                    report["summary"]["high"] += 1
+        report["scans"][name] = result
+        
+        findings_count = len(result.get("findings", []))
+        report["summary"]["total_findings"] += findings_count
+        
+        for finding in result.get("findings", []):
+            sev = finding.get("severity", "low")
+            if sev == "critical":
+                report["summary"]["critical"] += 1
+            elif sev == "high":
+                report["summary"]["high"] += 1
     
     # Determine overall status
-    if report["summary"]["critical"] > 0:
-        report["summary"]["overall_status"] = "[!!] CRITICAL ISSUES FOUND"
-    elif report["summary"]["high"] > 0:
-        report["summary"]["overall_status"] = "[!] HIGH RISK ISSUES"
-    elif report["summary"]["total_findings"] > 0:
-        report["summary"]["overall_status"] = "[?] REVIEW RECOMMENDED"
+    report["summary"]["overall_status"] = overall_status(report["summary"])
     
     return report
 
 
-def main():
+def stream_full_scan(project_path: str, scan_type: str = "all", jobs: int = 1, use_cache: bool = True,
+                     changed_since: Optional[str] = None, limits: ScanLimits = DEFAULT_LIMITS,
+                     out=None) -> Dict[str, Any]:
+    """
+    Execute security validation scans, writing JSONL as findings are produced.
+
+    Every finding is written as {"record": "finding", "scan": <name>, ...}
+    the moment its file has been scanned, with no truncation. Only counters
+    are kept, and a final {"record": "summary", ...} carries each scan's
+    status and the overall summary. Returns that summary record.
+    """
+    out = out or sys.stdout
+    enabled = [key for key in SCANNERS if scan_type == "all" or scan_type == key]
+    scans = {}
+    summary = {"total_findings": 0, "critical": 0, "high": 0}
+
+    def emit(key: str, finding: Dict[str, Any]):
+        name = SCANNERS[key][0]
+        out.write(json.dumps({"record": "finding", "scan": name, **finding}) + "\n")
+        out.flush()
+        scan = scans[name]
+        scan["findings"] += 1
+        severity = finding.get("severity", "low")
+        weight = finding["count"] if key == "secrets" else 1  # secret severities count matches, like scan_secrets
+        scan["by_severity"][severity] = scan["by_severity"].get(severity, 0) + weight
+        if key == "patterns":
+            scan["by_category"][finding["category"]] = scan["by_category"].get(finding["category"], 0) + 1
+        summary["total_findings"] += 1
+        if severity in ("critical", "high"):
+            summary[severity] += 1
+
+    for key in enabled:
+        scans[SCANNERS[key][0]] = {"tool": None, "status": None, "findings": 0, "by_severity": {}}
+    if "patterns" in enabled:
+        scans["code_patterns"]["by_category"] = {}
+
+    if "deps" in enabled:
+        result = scan_dependencies(project_path)
+        for finding in result["findings"]:
+            emit("deps", finding)
+        scans["dependencies"].update(tool=result["tool"], status=result["status"])
+        if "npm_audit" in result:
+            scans["dependencies"]["npm_audit"] = result["npm_audit"]
+
+    file_keys = [key for key in enabled if key in FILE_SCANNERS]
+    changed = scoped_files(project_path, changed_since)
+    cache = FindingsCache(cache_path(project_path), limits).load() if use_cache else None
+    for key in file_keys:
+        scans[SCANNERS[key][0]].update(scanned_files=0, skipped_files=0)
+    for wanted, findings in iter_file_findings(project_path, file_keys, jobs, cache, changed, limits):
+        for key in wanted:
+            if findings is None:
+                scans[SCANNERS[key][0]]["skipped_files"] += 1
+                continue
+            scans[SCANNERS[key][0]]["scanned_files"] += 1
+            for finding in findings.get(key, []):
+                emit(key, finding)
+
+    if "secrets" in enabled:
+        scans["secrets"].update(tool="secret_scanner", status=secrets_status(scans["secrets"]["by_severity"]))
+    if "patterns" in enabled:
+        scans["code_patterns"].update(tool="pattern_scanner", status=patterns_status(scans["code_patterns"]["by_severity"]))
+    if "config" in enabled:
+        checks, header_findings = check_security_headers(project_path)
+        for finding in header_findings:
+            emit("config", finding)
+        scan = scans["configuration"]
+        scan.update(tool="config_scanner", checks=checks, status=config_status(set(scan["by_severity"])))
+    summary["overall_status"] = overall_status(summary)
+
+    record = {
+        "record": "summary",
+        "project": project_path,
+        "timestamp": datetime.now().isoformat(),
+        "scan_type": scan_type,
+        "changed_since": changed_since,
+        "scans": scans,
+        "summary": summary,
+    }
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+    return record
+
+
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(
         description="Validate security principles from vulnerability-scanner skill"
     )
     parser.add_argument("project_path", nargs="?", default=".", help="Project directory to scan")
     parser.add_argument("--scan-type", choices=["all", "deps", "secrets", "patterns", "config"],
                         default="all", help="Type of scan to run")
-    parser.add_argument("--output", choices=["json", "summary"], default="json",
-                        help="Output format")
+    parser.add_argument("--output", choices=["json", "summary", "jsonl"], default="json",
+                        help="Output format (jsonl: stream every finding, untruncated, then a summary record)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Scan files in N worker processes (0 = one per CPU)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Rescan every file instead of reusing cached findings")
+    parser.add_argument("--changed-since", metavar="REF",
+                        help="Only scan files changed since this git ref (plus uncommitted and untracked files)")
+    parser.add_argument("--max-file-size", type=float, default=None, metavar="MB",
+                        help="Skip files larger than this (default: no limit)")
+    parser.add_argument("--minified", choices=["scan", "downgrade", "skip"], default=DEFAULT_LIMITS.minified,
+                        help="Minified bundles / lockfiles: scan normally (default), downgrade non-secret findings to low, "
+                             "or skip non-secret scanners")
+    parser.add_argument("--mmap-above", type=float, default=None, metavar="MB",
+                        help="Scan files larger than this through mmap as bytes to save memory; matching is then "
+                             "ASCII-only, so findings on non-ASCII text can differ (default: read every file as text)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not os.path.isdir(args.project_path):
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    max_bytes = int(args.max_file_size * (1 << 20)) if args.max_file_size is not None else None
+    mmap_bytes = int(args.mmap_above * (1 << 20)) if args.mmap_above is not None else None
+    limits = DEFAULT_LIMITS._replace(max_bytes=max_bytes, mmap_bytes=mmap_bytes, minified=args.minified)
+    try:
+        if args.output == "jsonl":
+            stream_full_scan(args.project_path, args.scan_type, jobs, not args.no_cache, args.changed_since, limits)
+            return
+        result = run_full_scan(args.project_path, args.scan_type, jobs, not args.no_cache, args.changed_since, limits)
+    except GitDiffError as e:
+        print(json.dumps({"error": f"--changed-since: {e}"}))
+        sys.exit(1)
     
     if args.output == "summary":
         print(f"\n{'='*60}")